@@ -22,6 +22,27 @@ const getDispatchCache = (): DispatchCache => {
   return map;
 };
 
+type LiveKitClients = {
+  key: string;
+  dispatch: AgentDispatchClient;
+  rooms: RoomServiceClient;
+};
+
+// Both clients are stateless wrappers around the same credentials; keep one pair per config so
+// repeated dispatches skip re-deriving them.
+let cachedClients: LiveKitClients | null = null;
+
+const getLiveKitClients = (url: string, apiKey: string, apiSecret: string): LiveKitClients => {
+  const key = `${url}\u0000${apiKey}\u0000${apiSecret}`;
+  if (cachedClients?.key === key) return cachedClients;
+  cachedClients = {
+    key,
+    dispatch: new AgentDispatchClient(url, apiKey, apiSecret),
+    rooms: new RoomServiceClient(url, apiKey, apiSecret),
+  };
+  return cachedClients;
+};
+
 const normalizeIdentity = (value: string) => value.trim().toLowerCase();
 
 const isAgentParticipantIdentity = (identity: string, agentName: string): boolean => {
@@ -71,8 +92,11 @@ export async function POST(request: NextRequest) {
     try {
       // Use official AgentDispatchClient from livekit-server-sdk
       const agentDispatchUrl = serverUrl.replace('wss://', 'https://').replace('ws://', 'http://');
-      const client = new AgentDispatchClient(agentDispatchUrl, apiKey, apiSecret);
-      const roomClient = new RoomServiceClient(agentDispatchUrl, apiKey, apiSecret);
+      const { dispatch: client, rooms: roomClient } = getLiveKitClients(
+        agentDispatchUrl,
+        apiKey,
+        apiSecret,
+      );
       const agentName =
         (process.env.LIVEKIT_VOICE_AGENT_NAME || process.env.LIVEKIT_AGENT_NAME || 'voice-agent').trim();
       const dedupeKey = `${normalizedRoomName}::${agentName}`;
@@ -1,5 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { runYouTubeSteward } from '@/lib/agents/subagents/youtube-steward';
+import { createLogger } from '@/lib/logging';
+
+const logger = createLogger('api:ai:youtube-steward');
 
 export async function POST(req: NextRequest) {
   try {
@@ -17,7 +20,7 @@ export async function POST(req: NextRequest) {
 
     return NextResponse.json({ status: 'ok', action });
   } catch (error) {
-    console.error('[YouTubeSteward API] Error:', error);
+    logger.error('request failed', error);
     return NextResponse.json(
       { status: 'error', error: error instanceof Error ? error.message : 'Unknown error' },
       { status: 500 }
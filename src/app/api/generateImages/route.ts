@@ -3,6 +3,7 @@ import { z } from 'zod';
 import { NextRequest, NextResponse } from 'next/server';
 import { BYOK_ENABLED } from '@/lib/agents/shared/byok-flags';
 import { resolveRequestUserId } from '@/lib/supabase/server/resolve-request-user';
+import { createKeyedClientCache } from '@/lib/server/keyed-client-cache';
 import { resolveProviderKeyWithFallback } from '@/lib/agents/control-plane/key-resolution';
 import {
   DEFAULT_IMAGE_ASPECT_RATIO,
@@ -76,6 +77,13 @@ const readProviderErrorMessage = (payload: Record<string, unknown> | null, fallb
 
 const DEFAULT_IMAGE_MIME_TYPE = 'image/png';
 
+// One SDK client (and its keep-alive agent) per BYOK key.
+const MAX_CACHED_OPENAI_CLIENTS = 32;
+const getOpenAIClient = createKeyedClientCache(
+  (apiKey) => new OpenAI({ apiKey }),
+  MAX_CACHED_OPENAI_CLIENTS,
+);
+
 const normalizeImageMimeType = (value: unknown): string =>
   typeof value === 'string' && value.startsWith('image/') ? value : DEFAULT_IMAGE_MIME_TYPE;
 
@@ -213,7 +221,7 @@ async function generateWithOpenAI(apiKey: string, request: GenerateRequest, fina
   const aspectRatio = clampAspectRatio(request.model, request.aspectRatio);
   const resolution = clampResolutionPreset(request.model, request.resolution);
   const quality = clampQualityPreset(request.model, request.quality);
-  const client = new OpenAI({ apiKey });
+  const client = getOpenAIClient(apiKey);
   const image = await client.images.generate({
     model: 'gpt-image-1.5',
     prompt: finalPrompt,
@@ -6,6 +6,9 @@ import {
 } from '@/lib/agents/subagents/flowchart-steward-registry';
 import { assertCanvasMember, parseCanvasIdFromRoom } from '@/lib/agents/shared/canvas-billing';
 import { resolveRequestUserId } from '@/lib/supabase/server/resolve-request-user';
+import { createLogger } from '@/lib/logging';
+
+const logger = createLogger('api:steward:run');
 
 export async function POST(req: NextRequest) {
   try {
@@ -62,7 +65,7 @@ export async function POST(req: NextRequest) {
 
     after(async () => {
       try {
-        console.log('[Steward][run] scheduled', {
+        logger.info('scheduled', {
           room: trimmedRoom,
           docId: trimmedDocId,
           windowMs: resolvedWindow,
@@ -76,7 +79,7 @@ export async function POST(req: NextRequest) {
           mode: normalizedMode,
           ...(billingUserId ? { billingUserId } : {}),
         });
-        console.log('[Steward][run] completed', {
+        logger.info('completed', {
           room: trimmedRoom,
           docId: trimmedDocId,
           windowMs: resolvedWindow,
@@ -84,7 +87,7 @@ export async function POST(req: NextRequest) {
           reason: normalizedReason,
         });
       } catch (error) {
-        console.error('[Steward][run] error', {
+        logger.error('error', {
           room: trimmedRoom,
           docId: trimmedDocId,
           windowMs: resolvedWindow,
@@ -97,7 +100,7 @@ export async function POST(req: NextRequest) {
 
     return NextResponse.json({ status: 'scheduled' }, { status: 202 });
   } catch (error) {
-    console.error('Invalid request to steward/run', error);
+    logger.error('invalid request', error);
     return NextResponse.json({ error: 'Bad Request' }, { status: 400 });
   }
 }
@@ -0,0 +1,74 @@
+/** @jest-environment node */
+
+import type { NextRequest } from 'next/server';
+
+const fetchYouTubeJsonMock = jest.fn();
+
+jest.mock('@/lib/youtube/http', () => ({
+  ...jest.requireActual('@/lib/youtube/http'),
+  fetchYouTubeJson: (...args: unknown[]) => fetchYouTubeJsonMock(...args),
+}));
+
+import { GET } from './route';
+
+const request = (query: string) =>
+  ({ url: `http://localhost/api/youtube/search?${query}` }) as NextRequest;
+
+describe('/api/youtube/search', () => {
+  const originalApiKey = process.env.YOUTUBE_API_KEY;
+
+  beforeEach(() => {
+    fetchYouTubeJsonMock.mockReset();
+    process.env.YOUTUBE_API_KEY = 'test-key';
+  });
+
+  afterAll(() => {
+    if (typeof originalApiKey === 'undefined') {
+      delete process.env.YOUTUBE_API_KEY;
+    } else {
+      process.env.YOUTUBE_API_KEY = originalApiKey;
+    }
+  });
+
+  it('requests details once per distinct video id in search order', async () => {
+    fetchYouTubeJsonMock.mockImplementation(async (url: string) => {
+      const parsed = new URL(url);
+      if (parsed.pathname.endsWith('/search')) {
+        return {
+          items: [
+            { id: { videoId: 'dQw4w9WgXcQ' } },
+            { id: { videoId: '9bZkp7q19f0' } },
+            { id: { videoId: 'dQw4w9WgXcQ' } },
+          ],
+        };
+      }
+      const ids = parsed.searchParams.get('id')?.split(',') ?? [];
+      return { items: ids.map((id) => ({ id, snippet: { title: id } })) };
+    });
+
+    const response = await GET(request('q=duplicate%20ids'));
+    const payload = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(fetchYouTubeJsonMock).toHaveBeenCalledTimes(2);
+    const videosUrl = new URL(fetchYouTubeJsonMock.mock.calls[1][0]);
+    expect(videosUrl.searchParams.get('id')).toBe('dQw4w9WgXcQ,9bZkp7q19f0');
+    expect(payload.items.map((item: { id: string }) => item.id)).toEqual([
+      'dQw4w9WgXcQ',
+      '9bZkp7q19f0',
+    ]);
+  });
+
+  it('returns 429 with Retry-After when the Data API limit trips', async () => {
+    fetchYouTubeJsonMock.mockRejectedValue(
+      Object.assign(new Error('YOUTUBE_API_RATE_LIMITED'), { retryAfterSec: 7 }),
+    );
+
+    const response = await GET(request('q=rate%20limited'));
+    const payload = await response.json();
+
+    expect(response.status).toBe(429);
+    expect(response.headers.get('Retry-After')).toBe('7');
+    expect(payload.retryAfterSec).toBe(7);
+  });
+});
@@ -1,24 +1,20 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { z } from 'zod';
+import { createTtlCache, parseTtlSecEnv } from '@/lib/server/ttl-cache';
+import {
+  YOUTUBE_DATA_API_BASE,
+  fetchYouTubeJson,
+  getYouTubeRetryAfterSec,
+} from '@/lib/youtube/http';
+import {
+  loadVideosByIds,
+  mapVideo,
+  writeCachedVideos,
+  type YouTubeVideoItem,
+} from '@/lib/youtube/videos';
 
 export const runtime = 'nodejs';
 
-type YouTubeThumbnail = { url: string; width: number; height: number };
-
-type YouTubeVideoItem = {
-  id: string;
-  title: string;
-  description: string;
-  channelTitle: string;
-  channelId: string;
-  publishedAt: string;
-  duration: string;
-  viewCount: string;
-  likeCount: string;
-  commentCount: string;
-  thumbnail: YouTubeThumbnail;
-};
-
 const SearchQuerySchema = z.object({
   q: z.string().optional(),
   maxResults: z.coerce.number().int().min(1).max(25).default(10),
@@ -29,50 +25,12 @@ const SearchQuerySchema = z.object({
   trending: z.coerce.boolean().optional(),
 });
 
-function pickBestThumb(snippet: any): YouTubeThumbnail {
-  const thumbs = snippet?.thumbnails || {};
-  const best = thumbs.maxres || thumbs.high || thumbs.medium || thumbs.default;
-  if (best?.url) {
-    return {
-      url: String(best.url),
-      width: Number(best.width) || 0,
-      height: Number(best.height) || 0,
-    };
-  }
-  return { url: '', width: 0, height: 0 };
-}
-
-async function fetchJson(url: string) {
-  const res = await fetch(url, { method: 'GET' });
-  const text = await res.text();
-  if (!res.ok) {
-    throw new Error(`YouTube API error: HTTP ${res.status} - ${text.slice(0, 200)}`);
-  }
-  try {
-    return JSON.parse(text) as any;
-  } catch {
-    throw new Error(`YouTube API error: invalid json - ${text.slice(0, 200)}`);
-  }
-}
-
-function mapVideo(item: any): YouTubeVideoItem {
-  const snippet = item?.snippet || {};
-  const stats = item?.statistics || {};
-  const details = item?.contentDetails || {};
-  return {
-    id: String(item?.id || ''),
-    title: String(snippet?.title || ''),
-    description: String(snippet?.description || ''),
-    channelTitle: String(snippet?.channelTitle || ''),
-    channelId: String(snippet?.channelId || ''),
-    publishedAt: String(snippet?.publishedAt || ''),
-    duration: String(details?.duration || ''),
-    viewCount: String(stats?.viewCount ?? '0'),
-    likeCount: String(stats?.likeCount ?? '0'),
-    commentCount: String(stats?.commentCount ?? '0'),
-    thumbnail: pickBestThumb(snippet),
-  };
-}
+// Identical searches (same query + filters) are common while a user refines a canvas or the
+// agent replays a request; serving them from memory skips two Data API round-trips and quota.
+const searchCache = createTtlCache<YouTubeVideoItem[]>({
+  ttlMs: parseTtlSecEnv(process.env.YOUTUBE_SEARCH_CACHE_TTL_SEC, 300),
+  maxEntries: 500,
+});
 
 export async function GET(req: NextRequest) {
   const apiKey = process.env.YOUTUBE_API_KEY?.trim();
@@ -99,27 +57,46 @@ export async function GET(req: NextRequest) {
   const trendingRaw = searchParams.get('trending');
   const trending = trendingRaw === '1' || trendingRaw === 'true';
 
+  const query = (q || '').trim();
+  const region = (regionCode || (trending ? 'US' : '')).toUpperCase().slice(0, 2);
+  const cacheKey = trending
+    ? ['trending', region, maxResults].join('|')
+    : [
+        'search',
+        query.toLowerCase(),
+        maxResults,
+        order,
+        publishedAfter ?? '',
+        videoDuration ?? '',
+        region,
+      ].join('|');
+  const cachedItems = searchCache.get(cacheKey);
+  if (cachedItems) {
+    return NextResponse.json({ items: cachedItems });
+  }
+
   try {
     if (trending) {
-      const region = (regionCode || 'US').toUpperCase().slice(0, 2);
-      const url = new URL('https://www.googleapis.com/youtube/v3/videos');
+      const url = new URL(`${YOUTUBE_DATA_API_BASE}/videos`);
       url.searchParams.set('part', 'snippet,contentDetails,statistics');
       url.searchParams.set('chart', 'mostPopular');
       url.searchParams.set('maxResults', String(maxResults));
       url.searchParams.set('regionCode', region);
       url.searchParams.set('key', apiKey);
 
-      const json = await fetchJson(url.toString());
+      const json = await fetchYouTubeJson(url.toString());
       const items: any[] = Array.isArray(json?.items) ? json.items : [];
-      return NextResponse.json({ items: items.map(mapVideo) });
+      const mapped = items.map(mapVideo);
+      writeCachedVideos(mapped);
+      searchCache.set(cacheKey, mapped);
+      return NextResponse.json({ items: mapped });
     }
 
-    const query = (q || '').trim();
     if (!query) {
       return NextResponse.json({ items: [] });
     }
 
-    const searchUrl = new URL('https://www.googleapis.com/youtube/v3/search');
+    const searchUrl = new URL(`${YOUTUBE_DATA_API_BASE}/search`);
     searchUrl.searchParams.set('part', 'snippet');
     searchUrl.searchParams.set('type', 'video');
     searchUrl.searchParams.set('q', query);
@@ -127,33 +104,38 @@ export async function GET(req: NextRequest) {
     searchUrl.searchParams.set('order', order);
     if (publishedAfter) searchUrl.searchParams.set('publishedAfter', publishedAfter);
     if (videoDuration) searchUrl.searchParams.set('videoDuration', videoDuration);
-    if (regionCode) searchUrl.searchParams.set('regionCode', regionCode.toUpperCase().slice(0, 2));
+    if (region) searchUrl.searchParams.set('regionCode', region);
     searchUrl.searchParams.set('key', apiKey);
 
-    const searchJson = await fetchJson(searchUrl.toString());
+    const searchJson = await fetchYouTubeJson(searchUrl.toString());
     const searchItems: any[] = Array.isArray(searchJson?.items) ? searchJson.items : [];
-    const ids = searchItems
-      .map((it) => it?.id?.videoId)
-      .filter((id) => typeof id === 'string' && id.trim().length > 0)
-      .slice(0, 50);
+    // search.list can repeat a video across pages/variants; the id list is also the row order.
+    const ids = Array.from(
+      new Set<string>(
+        searchItems
+          .map((it) => it?.id?.videoId)
+          .filter((id): id is string => typeof id === 'string' && id.trim().length > 0),
+      ),
+    ).slice(0, 50);
 
     if (ids.length === 0) {
       return NextResponse.json({ items: [] });
     }
 
-    const videosUrl = new URL('https://www.googleapis.com/youtube/v3/videos');
-    videosUrl.searchParams.set('part', 'snippet,contentDetails,statistics');
-    videosUrl.searchParams.set('id', ids.join(','));
-    videosUrl.searchParams.set('key', apiKey);
-
-    const videosJson = await fetchJson(videosUrl.toString());
-    const videos: any[] = Array.isArray(videosJson?.items) ? videosJson.items : [];
+    // Details for videos seen recently (other searches, trending, the video route) come from the
+    // per-id cache; only the rest cost a videos.list call.
+    const mapped = await loadVideosByIds(ids, apiKey);
+    searchCache.set(cacheKey, mapped);
 
-    const byId = new Map<string, any>(videos.map((it) => [String(it?.id || ''), it]));
-    const ordered = ids.map((id) => byId.get(id)).filter(Boolean);
-
-    return NextResponse.json({ items: ordered.map(mapVideo) });
+    return NextResponse.json({ items: mapped });
   } catch (error) {
+    const retryAfterSec = getYouTubeRetryAfterSec(error);
+    if (retryAfterSec !== null) {
+      return NextResponse.json(
+        { error: 'Rate limit exceeded', retryAfterSec },
+        { status: 429, headers: { 'Retry-After': String(retryAfterSec) } },
+      );
+    }
     const message = error instanceof Error ? error.message : String(error);
     return NextResponse.json({ error: message }, { status: 502 });
   }
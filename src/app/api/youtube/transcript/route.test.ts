@@ -0,0 +1,71 @@
+/** @jest-environment node */
+
+import type { NextRequest } from 'next/server';
+
+const fetchYouTubeWithRetryMock = jest.fn();
+
+jest.mock('@/lib/youtube/http', () => ({
+  fetchYouTubeWithRetry: (...args: unknown[]) => fetchYouTubeWithRetryMock(...args),
+}));
+
+import { GET } from './route';
+
+const request = (videoId: string) =>
+  ({ url: `http://localhost/api/youtube/transcript?videoId=${videoId}&lang=en` }) as NextRequest;
+
+const watchPage = (playerResponse: unknown) =>
+  `<html><script>var ytInitialPlayerResponse = ${JSON.stringify(playerResponse)};</script></html>`;
+
+const CAPTION_TRACK = { languageCode: 'en', baseUrl: 'https://youtube.test/timedtext' };
+const CAPTIONS_VTT = 'WEBVTT\n\n00:00:00.000 --> 00:00:01.500\nHello there\n';
+
+describe('/api/youtube/transcript', () => {
+  beforeEach(() => {
+    fetchYouTubeWithRetryMock.mockReset();
+  });
+
+  it('serves a repeated transcript request from the cache', async () => {
+    fetchYouTubeWithRetryMock.mockImplementation(async (url: string) =>
+      url.includes('/watch')
+        ? new Response(
+            watchPage({
+              captions: { playerCaptionsTracklistRenderer: { captionTracks: [CAPTION_TRACK] } },
+            }),
+          )
+        : new Response(CAPTIONS_VTT),
+    );
+
+    const first = await (await GET(request('cachedVide1'))).json();
+    const second = await (await GET(request('cachedVide1'))).json();
+
+    expect(first.transcript.segments).toEqual([{ text: 'Hello there', start: 0, duration: 1.5 }]);
+    expect(second).toEqual(first);
+    expect(fetchYouTubeWithRetryMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('caches no_captions when the watch page carried a player response', async () => {
+    fetchYouTubeWithRetryMock.mockImplementation(async () =>
+      new Response(watchPage({ playabilityStatus: { status: 'OK' } })),
+    );
+
+    const first = await (await GET(request('noCaptions1'))).json();
+    const second = await (await GET(request('noCaptions1'))).json();
+
+    expect(first).toEqual({ transcript: null, error: 'no_captions' });
+    expect(second).toEqual(first);
+    expect(fetchYouTubeWithRetryMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('does not cache no_captions when the player response is missing', async () => {
+    fetchYouTubeWithRetryMock.mockImplementation(async () =>
+      new Response('<html>consent required</html>'),
+    );
+
+    const first = await (await GET(request('consentWal1'))).json();
+    const second = await (await GET(request('consentWal1'))).json();
+
+    expect(first).toEqual({ transcript: null, error: 'no_captions' });
+    expect(second).toEqual(first);
+    expect(fetchYouTubeWithRetryMock).toHaveBeenCalledTimes(2);
+  });
+});
@@ -1,5 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { z } from 'zod';
+import { createTtlCache, parseTtlSecEnv } from '@/lib/server/ttl-cache';
+import { fetchYouTubeWithRetry } from '@/lib/youtube/http';
+import { YOUTUBE_VIDEO_ID_PATTERN } from '@/lib/youtube/videos';
 
 export const runtime = 'nodejs';
 
@@ -10,10 +13,36 @@ type TranscriptSegment = {
 };
 
 const QuerySchema = z.object({
-  videoId: z.string().min(6),
+  videoId: z.string().regex(YOUTUBE_VIDEO_ID_PATTERN),
   lang: z.string().optional().default('en'),
 });
 
+// Best-effort: mimic a normal browser so the watch page includes the player response.
+const WATCH_PAGE_HEADERS: Readonly<Record<string, string>> = Object.freeze({
+  'User-Agent':
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+  'Accept-Language': 'en-US,en;q=0.9',
+});
+
+type TranscriptResult =
+  | { segments: TranscriptSegment[]; lang?: string }
+  | { segments: null; error: string };
+
+// Captions for a given video rarely change, and the same transcript is reopened whenever a user
+// reselects a video; caching skips both the watch-page scrape and the caption download.
+const TRANSCRIPT_CACHE_TTL_MS = parseTtlSecEnv(process.env.YOUTUBE_TRANSCRIPT_CACHE_TTL_SEC, 3600);
+const transcriptCache = createTtlCache<TranscriptResult>({
+  ttlMs: TRANSCRIPT_CACHE_TTL_MS,
+  maxEntries: 200,
+});
+// Videos without captions are remembered briefly so repeat lookups skip the ~1MB watch-page
+// scrape, while captions added later still show up within minutes.
+const MISSING_CAPTIONS_CACHE_TTL_MS = Math.min(TRANSCRIPT_CACHE_TTL_MS, 10 * 60_000);
+
+const CAPTION_TAG_PATTERN = /<[^>]+>/g;
+const WHITESPACE_RUN_PATTERN = /\s+/g;
+const LINE_BREAK_PATTERN = /\r?\n/;
+
 function extractJsonFromAssignment(html: string, varName: string): any | null {
   const idx = html.indexOf(varName);
   if (idx === -1) return null;
@@ -74,11 +103,13 @@ function parseTimestamp(ts: string): number {
 }
 
 function stripTags(text: string): string {
-  return text.replace(/<[^>]+>/g, '').replace(/\s+/g, ' ').trim();
+  // Most cues are plain text; only auto-generated tracks carry inline <c>/timestamp tags.
+  const untagged = text.includes('<') ? text.replace(CAPTION_TAG_PATTERN, '') : text;
+  return untagged.replace(WHITESPACE_RUN_PATTERN, ' ').trim();
 }
 
 function parseVtt(vtt: string): TranscriptSegment[] {
-  const lines = vtt.split(/\r?\n/);
+  const lines = vtt.split(LINE_BREAK_PATTERN);
   const segments: TranscriptSegment[] = [];
 
   let i = 0;
@@ -93,7 +124,7 @@ function parseVtt(vtt: string): TranscriptSegment[] {
     const timeLine = maybeTime;
     if (line !== maybeTime) i += 1;
 
-    const [rawStart, rawEnd] = timeLine.split('-->').map((v) => v.trim().split(/\s+/)[0]);
+    const [rawStart, rawEnd] = timeLine.split('-->').map((v) => v.trim().split(WHITESPACE_RUN_PATTERN)[0]);
     if (!rawStart || !rawEnd) continue;
     const start = parseTimestamp(rawStart);
     const end = parseTimestamp(rawEnd);
@@ -109,20 +140,13 @@ function parseVtt(vtt: string): TranscriptSegment[] {
 
     const text = stripTags(textLines.join(' '));
     if (!text) continue;
+    // Light dedupe (YouTube captions can repeat)
+    const prev = segments[segments.length - 1];
+    if (prev && prev.text === text && Math.abs(prev.start - start) < 0.25) continue;
     segments.push({ text, start, duration: duration || 0 });
   }
 
-  // Light dedupe (YouTube captions can repeat)
-  const deduped: TranscriptSegment[] = [];
-  for (const seg of segments) {
-    const prev = deduped[deduped.length - 1];
-    if (prev && prev.text === seg.text && Math.abs(prev.start - seg.start) < 0.25) {
-      continue;
-    }
-    deduped.push(seg);
-  }
-
-  return deduped;
+  return segments;
 }
 
 export async function GET(req: NextRequest) {
@@ -136,18 +160,18 @@ export async function GET(req: NextRequest) {
   }
 
   const { videoId, lang } = parsed.data;
+  const cacheKey = `${videoId}|${String(lang || 'en').toLowerCase()}`;
+  const cached = transcriptCache.get(cacheKey);
+  if (cached) {
+    if (cached.segments === null) {
+      return NextResponse.json({ transcript: null, error: cached.error });
+    }
+    return NextResponse.json({ transcript: { segments: cached.segments }, track: { lang: cached.lang } });
+  }
 
   try {
     const watchUrl = `https://www.youtube.com/watch?v=${encodeURIComponent(videoId)}`;
-    const htmlRes = await fetch(watchUrl, {
-      method: 'GET',
-      headers: {
-        // Best-effort: mimic a normal browser
-        'User-Agent':
-          'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-        'Accept-Language': 'en-US,en;q=0.9',
-      },
-    });
+    const htmlRes = await fetchYouTubeWithRetry(watchUrl, { headers: WATCH_PAGE_HEADERS });
     const html = await htmlRes.text();
     if (!htmlRes.ok) {
       return NextResponse.json({ transcript: null, error: `watch_http_${htmlRes.status}` }, { status: 502 });
@@ -161,6 +185,15 @@ export async function GET(req: NextRequest) {
       [];
 
     if (!Array.isArray(captionTracks) || captionTracks.length === 0) {
+      // Only trust the negative result when the page actually carried a player response; a
+      // consent/bot wall also lacks captions but should be retried.
+      if (playerResponse) {
+        transcriptCache.set(
+          cacheKey,
+          { segments: null, error: 'no_captions' },
+          MISSING_CAPTIONS_CACHE_TTL_MS,
+        );
+      }
       return NextResponse.json({ transcript: null, error: 'no_captions' });
     }
 
@@ -186,7 +219,7 @@ export async function GET(req: NextRequest) {
       captionsUrl.searchParams.set('fmt', 'vtt');
     }
 
-    const vttRes = await fetch(captionsUrl.toString(), { method: 'GET' });
+    const vttRes = await fetchYouTubeWithRetry(captionsUrl.toString());
     const vttText = await vttRes.text();
     if (!vttRes.ok) {
       return NextResponse.json({ transcript: null, error: `caption_http_${vttRes.status}` });
@@ -197,6 +230,7 @@ export async function GET(req: NextRequest) {
       return NextResponse.json({ transcript: null, error: 'caption_parse_empty' });
     }
 
+    transcriptCache.set(cacheKey, { segments, lang: track?.languageCode });
     return NextResponse.json({ transcript: { segments }, track: { lang: track?.languageCode } });
   } catch (error) {
     const message = error instanceof Error ? error.message : String(error);
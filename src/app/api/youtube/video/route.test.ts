@@ -0,0 +1,66 @@
+/** @jest-environment node */
+
+import type { NextRequest } from 'next/server';
+
+const loadVideosByIdsMock = jest.fn();
+
+jest.mock('@/lib/youtube/videos', () => ({
+  ...jest.requireActual('@/lib/youtube/videos'),
+  loadVideosByIds: (...args: unknown[]) => loadVideosByIdsMock(...args),
+}));
+
+import { GET } from './route';
+
+const request = (query: string) =>
+  ({ url: `http://localhost/api/youtube/video?${query}` }) as NextRequest;
+
+describe('/api/youtube/video', () => {
+  const originalApiKey = process.env.YOUTUBE_API_KEY;
+
+  beforeEach(() => {
+    loadVideosByIdsMock.mockReset();
+    loadVideosByIdsMock.mockImplementation(async (ids: string[]) => ids.map((id) => ({ id })));
+    process.env.YOUTUBE_API_KEY = 'test-key';
+  });
+
+  afterAll(() => {
+    if (typeof originalApiKey === 'undefined') {
+      delete process.env.YOUTUBE_API_KEY;
+    } else {
+      process.env.YOUTUBE_API_KEY = originalApiKey;
+    }
+  });
+
+  it('looks up each distinct id once', async () => {
+    const response = await GET(request('ids=dQw4w9WgXcQ,dQw4w9WgXcQ,9bZkp7q19f0'));
+    const payload = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(loadVideosByIdsMock).toHaveBeenCalledWith(['dQw4w9WgXcQ', '9bZkp7q19f0'], 'test-key');
+    expect(payload.items).toEqual([{ id: 'dQw4w9WgXcQ' }, { id: '9bZkp7q19f0' }]);
+  });
+
+  it('drops malformed ids before calling the Data API', async () => {
+    const mixed = await GET(request('ids=bad.video,dQw4w9WgXcQ'));
+    expect(loadVideosByIdsMock).toHaveBeenCalledWith(['dQw4w9WgXcQ'], 'test-key');
+    expect((await mixed.json()).items).toEqual([{ id: 'dQw4w9WgXcQ' }]);
+
+    loadVideosByIdsMock.mockClear();
+    const malformed = await GET(request('id=short'));
+    expect(loadVideosByIdsMock).not.toHaveBeenCalled();
+    expect((await malformed.json()).items).toEqual([]);
+  });
+
+  it('returns 429 with Retry-After when the Data API limit trips', async () => {
+    loadVideosByIdsMock.mockRejectedValue(
+      Object.assign(new Error('YOUTUBE_API_RATE_LIMITED'), { retryAfterSec: 12 }),
+    );
+
+    const response = await GET(request('id=dQw4w9WgXcQ'));
+    const payload = await response.json();
+
+    expect(response.status).toBe(429);
+    expect(response.headers.get('Retry-After')).toBe('12');
+    expect(payload.retryAfterSec).toBe(12);
+  });
+});
@@ -17,6 +17,16 @@ const YoutubeEmbed = dynamic(
   },
 );
 
+const OFFICIAL_CHANNEL_PATTERN = /official|vevo/i;
+// YouTube contentDetails.duration, e.g. PT1H2M3S.
+const ISO_DURATION_PATTERN = /PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?/;
+// Zero-padded 00-59, shared by every timestamp instead of padStart per field.
+const TWO_DIGITS = Array.from({ length: 60 }, (_, i) => (i < 10 ? `0${i}` : String(i)));
+// Hover must rest on a card this long before its transcript is prefetched, and only a couple of
+// prefetches run at once, so sweeping the cursor across the grid does not fan out requests.
+const TRANSCRIPT_PREFETCH_HOVER_DELAY_MS = 200;
+const MAX_CONCURRENT_TRANSCRIPT_PREFETCHES = 2;
+
 // Enhanced search parameters schema
 export const youtubeSearchEnhancedSchema = z.object({
   title: z.string().optional().describe('Title displayed above the search interface'),
@@ -107,6 +117,11 @@ export function YoutubeSearchEnhanced({
   });
 
   const searchTimeoutRef = useRef<number | null>(null);
+  // One in-flight/settled transcript request per video, so a hover prefetch and the later click
+  // share a single round-trip.
+  const transcriptRequestsRef = useRef(new Map<string, Promise<TranscriptSegment[] | null>>());
+  const prefetchTimeoutRef = useRef<number | null>(null);
+  const activePrefetchesRef = useRef(0);
 
   const fetchJson = useCallback(async (url: string) => {
     const res = await fetch(url, { method: 'GET' });
@@ -139,7 +154,7 @@ export function YoutubeSearchEnhanced({
         const json = await fetchJson(url.toString());
         const items: VideoResult[] = Array.isArray(json?.items) ? json.items : [];
         const filtered = filters.officialOnly
-          ? items.filter((item) => /official|vevo/i.test(item.channelTitle))
+          ? items.filter((item) => OFFICIAL_CHANNEL_PATTERN.test(item.channelTitle))
           : items;
 
         setState((prev) =>
@@ -186,6 +201,9 @@ export function YoutubeSearchEnhanced({
       if (searchTimeoutRef.current != null) {
         window.clearTimeout(searchTimeoutRef.current);
       }
+      if (prefetchTimeoutRef.current != null) {
+        window.clearTimeout(prefetchTimeoutRef.current);
+      }
     };
   }, []);
 
@@ -206,17 +224,60 @@ export function YoutubeSearchEnhanced({
     }
   }, [showTrending, fetchJson, setState]);
 
+  const requestTranscript = useCallback(
+    (videoId: string) => {
+      const requests = transcriptRequestsRef.current;
+      const existing = requests.get(videoId);
+      if (existing) return existing;
+      const url = new URL('/api/youtube/transcript', window.location.origin);
+      url.searchParams.set('videoId', videoId);
+      url.searchParams.set('lang', 'en');
+      const request = fetchJson(url.toString()).then(
+        (json) => (json?.transcript?.segments ?? null) as TranscriptSegment[] | null,
+      );
+      requests.set(videoId, request);
+      request.catch(() => {
+        requests.delete(videoId);
+      });
+      return request;
+    },
+    [fetchJson],
+  );
+
+  const cancelTranscriptPrefetch = useCallback(() => {
+    if (prefetchTimeoutRef.current != null) {
+      window.clearTimeout(prefetchTimeoutRef.current);
+      prefetchTimeoutRef.current = null;
+    }
+  }, []);
+
+  // Warm the transcript while the user is still deciding; failures are retried on select.
+  const prefetchTranscript = useCallback(
+    (videoId: string) => {
+      if (!showTranscripts) return;
+      cancelTranscriptPrefetch();
+      prefetchTimeoutRef.current = window.setTimeout(() => {
+        prefetchTimeoutRef.current = null;
+        if (transcriptRequestsRef.current.has(videoId)) return;
+        if (activePrefetchesRef.current >= MAX_CONCURRENT_TRANSCRIPT_PREFETCHES) return;
+        activePrefetchesRef.current += 1;
+        void requestTranscript(videoId)
+          .catch(() => { })
+          .finally(() => {
+            activePrefetchesRef.current -= 1;
+          });
+      }, TRANSCRIPT_PREFETCH_HOVER_DELAY_MS);
+    },
+    [showTranscripts, requestTranscript, cancelTranscriptPrefetch],
+  );
+
   // Load transcript for selected video
   const loadTranscript = useCallback(
     async (videoId: string) => {
       if (!showTranscripts) return;
 
       try {
-        const url = new URL('/api/youtube/transcript', window.location.origin);
-        url.searchParams.set('videoId', videoId);
-        url.searchParams.set('lang', 'en');
-        const json = await fetchJson(url.toString());
-        const segments: TranscriptSegment[] | null = json?.transcript?.segments ?? null;
+        const segments = await requestTranscript(videoId);
         setState((prev) =>
           prev
             ? {
@@ -229,7 +290,7 @@ export function YoutubeSearchEnhanced({
         console.error('Failed to load transcript:', error);
       }
     },
-    [showTranscripts, fetchJson, setState],
+    [showTranscripts, requestTranscript, setState],
   );
 
   // Get published after date based on filter
@@ -432,7 +493,13 @@ export function YoutubeSearchEnhanced({
       {state.view === 'search' && !state.loading && (
         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
           {state.searchResults.map((video) => (
-            <VideoCard key={video.id} video={video} onSelect={() => selectVideo(video)} />
+            <VideoCard
+              key={video.id}
+              video={video}
+              onSelect={() => selectVideo(video)}
+              onPrefetch={() => prefetchTranscript(video.id)}
+              onPrefetchCancel={cancelTranscriptPrefetch}
+            />
           ))}
           {state.searchResults.length === 0 && state.searchQuery && (
             <div className="col-span-full text-center py-12 text-gray-500">
@@ -450,6 +517,8 @@ export function YoutubeSearchEnhanced({
               key={video.id}
               video={video}
               onSelect={() => selectVideo(video)}
+              onPrefetch={() => prefetchTranscript(video.id)}
+              onPrefetchCancel={cancelTranscriptPrefetch}
               showTrendingBadge
             />
           ))}
@@ -535,15 +604,21 @@ export function YoutubeSearchEnhanced({
 function VideoCard({
   video,
   onSelect,
+  onPrefetch,
+  onPrefetchCancel,
   showTrendingBadge = false,
 }: {
   video: VideoResult;
   onSelect: () => void;
+  onPrefetch?: () => void;
+  onPrefetchCancel?: () => void;
   showTrendingBadge?: boolean;
 }) {
   return (
     <div
       onClick={onSelect}
+      onMouseEnter={onPrefetch}
+      onMouseLeave={onPrefetchCancel}
       className="cursor-pointer group hover:shadow-lg transition-shadow rounded-lg overflow-hidden border border-gray-200"
     >
       <div className="relative">
@@ -599,7 +674,7 @@ function VideoCard({
 // Helper functions
 function formatDuration(isoDuration: string): string {
   if (!isoDuration) return '';
-  const match = isoDuration.match(/PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?/);
+  const match = ISO_DURATION_PATTERN.exec(isoDuration);
   if (!match) return '';
 
   const hours = match[1] ? `${match[1]}:` : '';
@@ -630,12 +705,14 @@ function formatRelativeTime(dateString: string): string {
 }
 
 function formatTimestamp(seconds: number): string {
-  const hours = Math.floor(seconds / 3600);
-  const minutes = Math.floor((seconds % 3600) / 60);
-  const secs = Math.floor(seconds % 60);
+  // Truncate once; the rest is integer math for every rendered transcript row.
+  const total = Math.max(0, Math.floor(seconds) || 0);
+  const hours = Math.floor(total / 3600);
+  const minutes = Math.floor(total / 60) % 60;
+  const secs = total % 60;
 
   if (hours > 0) {
-    return `${hours}:${minutes.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
+    return `${hours}:${TWO_DIGITS[minutes]}:${TWO_DIGITS[secs]}`;
   }
-  return `${minutes}:${secs.toString().padStart(2, '0')}`;
+  return `${minutes}:${TWO_DIGITS[secs]}`;
 }
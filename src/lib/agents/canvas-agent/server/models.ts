@@ -1,11 +1,11 @@
 import { createAnthropic } from '@ai-sdk/anthropic';
 import { createOpenAI } from '@ai-sdk/openai';
-import Cerebras from '@cerebras/cerebras_cloud_sdk';
 import { generateObject, streamObject } from 'ai';
 import { z } from 'zod';
 import type { StructuredStream } from './streaming';
 import type { ModelTuning } from './model/presets';
 import { getRuntimeModelKey } from '@/lib/agents/shared/model-runtime-context';
+import { getCerebrasClient } from '@/lib/agents/fast-steward-config';
 import {
   describeRetryError,
   parseRetryEnvInt,
@@ -407,7 +407,7 @@ class CerebrasProvider implements StreamingProvider {
     if (!apiKey) {
       throw new Error('Provider not configured: cerebras');
     }
-    return new Cerebras({ apiKey });
+    return getCerebrasClient(apiKey);
   }
 }
 
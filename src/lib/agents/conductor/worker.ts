@@ -106,6 +106,7 @@ const workerClaimResourceLocks = Array.from(
 );
 let activeTaskCount = 0;
 let leasedTaskCount = 0;
+let leaseCapacityWaiters: Array<() => void> = [];
 type RoomLaneState = {
   active: number;
   waiters: Array<() => void>;
@@ -411,6 +412,29 @@ function createLeaseExtender(taskId: string, leaseToken: string) {
   };
 }
 
+function releaseLeasedTask() {
+  leasedTaskCount = Math.max(0, leasedTaskCount - 1);
+  const waiters = leaseCapacityWaiters;
+  leaseCapacityWaiters = [];
+  for (const wake of waiters) wake();
+}
+
+// Parks the claim loop while every lease slot is busy. It wakes as soon as a task finishes;
+// the timeout only keeps runtime settings refreshes flowing during long-running tasks.
+function waitForLeaseCapacity(timeoutMs: number): Promise<void> {
+  return new Promise((resolve) => {
+    const wake = () => {
+      clearTimeout(timer);
+      resolve();
+    };
+    const timer = setTimeout(() => {
+      leaseCapacityWaiters = leaseCapacityWaiters.filter((waiter) => waiter !== wake);
+      resolve();
+    }, timeoutMs);
+    leaseCapacityWaiters.push(wake);
+  });
+}
+
 async function acquireRoomSlot(roomKey: string): Promise<() => void> {
   const state = roomLaneStates.get(roomKey) ?? { active: 0, waiters: [] };
   if (!roomLaneStates.has(roomKey)) {
@@ -823,7 +847,7 @@ async function processClaimedTasks(executeTask: ExecuteTaskFn, claimedTasks: Cla
             if (countedActiveTask) {
               activeTaskCount = Math.max(0, activeTaskCount - 1);
             }
-            leasedTaskCount = Math.max(0, leasedTaskCount - 1);
+            releaseLeasedTask();
             stopLeaseExtender();
           }
         }
@@ -844,7 +868,7 @@ async function workerLoop(executeTask: ExecuteTaskFn) {
     const maxIdlePollMs = Math.max(baseIdlePollMs, conductorSettings.taskIdlePollMaxMs);
     const availableCapacity = Math.max(0, maxClaimConcurrency - leasedTaskCount);
     if (availableCapacity < 1) {
-      await delay(Math.min(100, baseIdlePollMs));
+      await waitForLeaseCapacity(1_000);
       continue;
     }
 
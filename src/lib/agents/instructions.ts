@@ -313,5 +313,7 @@ Always respond with tool calls. Keep confirmations minimal.
   const guidance = isLeanProfile ? leanGuidance : fullGuidance;
   const packGuidance = instructionPack === 'capability_explicit' ? capabilityExplicitSection : '';
 
-  return base + toolSection + componentSection + packGuidance + guidance;
+  // Static guidance goes first so sessions with different capability lists still share the
+  // longest possible prompt prefix (provider prompt caching matches on leading tokens).
+  return base + guidance + toolSection + componentSection + packGuidance;
 }
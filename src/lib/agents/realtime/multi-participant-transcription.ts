@@ -37,6 +37,10 @@ type SessionEntry = {
   stop: () => Promise<void>;
 };
 
+const TRANSCRIBER_INSTRUCTIONS =
+  'You are a transcription-only helper. ' +
+  'Do not respond, do not call tools. Only produce user input transcriptions.';
+
 const isAgentLike = (participant: any): boolean => {
   try {
     if (participant?.kind === ParticipantKind.AGENT) return true;
@@ -165,16 +169,12 @@ export class MultiParticipantTranscriptionManager {
   private findRemoteParticipantByIdentity(identity: string): any | null {
     const target = String(identity || '').trim();
     if (!target) return null;
-    let found: any | null = null;
     try {
-      this.room.remoteParticipants.forEach((participant: any) => {
-        if (found) return;
-        if (participant?.identity === target) found = participant;
-      });
+      // remoteParticipants is keyed by identity, so this is a direct lookup.
+      return this.room.remoteParticipants.get(target) ?? null;
     } catch {
-      /* noop */
+      return null;
     }
-    return found;
   }
 
   private async refreshParticipants() {
@@ -187,21 +187,24 @@ export class MultiParticipantTranscriptionManager {
       void entry.stop().catch(() => {});
     }
 
-    // Start sessions for new participants.
-    for (const participantId of desired) {
-      if (this.sessions.has(participantId)) continue;
-      const participant = this.findRemoteParticipantByIdentity(participantId);
-      if (!participant) continue;
-      try {
-        const entry = await this.startParticipant(participant as any);
-        this.sessions.set(participantId, entry);
-      } catch (error) {
-        console.warn('[MultiParticipantTranscription] failed to start transcriber', {
-          participantId,
-          error: error instanceof Error ? error.message : String(error),
-        });
-      }
-    }
+    // Start sessions for new participants. Each start opens its own realtime connection, so run
+    // them concurrently rather than making later joiners wait on earlier handshakes.
+    const pending = Array.from(desired).filter((participantId) => !this.sessions.has(participantId));
+    await Promise.all(
+      pending.map(async (participantId) => {
+        const participant = this.findRemoteParticipantByIdentity(participantId);
+        if (!participant) return;
+        try {
+          const entry = await this.startParticipant(participant as any);
+          this.sessions.set(participantId, entry);
+        } catch (error) {
+          console.warn('[MultiParticipantTranscription] failed to start transcriber', {
+            participantId,
+            error: error instanceof Error ? error.message : String(error),
+          });
+        }
+      }),
+    );
   }
 
   private async restartParticipant(participantId: string) {
@@ -220,12 +223,7 @@ export class MultiParticipantTranscriptionManager {
     }
     const speaker = getSpeakerLabel(participant);
 
-    const transcriberAgent = new voice.Agent({
-      instructions: [
-        'You are a transcription-only helper.',
-        'Do not respond, do not call tools. Only produce user input transcriptions.',
-      ].join(' '),
-    });
+    const transcriberAgent = new voice.Agent({ instructions: TRANSCRIBER_INSTRUCTIONS });
 
     const llm = new openaiRealtime.RealtimeModel({
       ...(this.realtimeModel ? { model: this.realtimeModel } : {}),
@@ -13,6 +13,7 @@ import { MultiParticipantTranscriptionManager } from './multi-participant-transc
 import { appendTranscriptCache, getTranscriptWindow, listCanvasComponents } from '@/lib/agents/shared/supabase-context';
 import { MutationArbiter } from '@/lib/agents/shared/mutation-arbiter';
 import { buildVoiceAgentInstructions, type VoiceInstructionPack } from '@/lib/agents/instructions';
+import { createLogger } from '@/lib/logging';
 import {
   queryCapabilities,
   defaultCapabilities,
@@ -36,6 +37,7 @@ import {
   recordToolIoEvent,
 } from '@/lib/agents/shared/replay-telemetry';
 import { createManualInputRouter } from './voice-agent/manual-routing';
+import { isBackchannelOnly } from './voice-agent/backchannel';
 import { VoiceComponentLedger } from './voice-agent/component-ledger';
 import { ScorecardService } from './voice-agent/scorecard-service';
 import { TranscriptionBuffer, type PendingTranscriptionMessage } from './voice-agent/transcription-buffer';
@@ -118,6 +120,7 @@ const readHeaderValue = (headers: unknown, key: string): string | undefined => {
 };
 
 const routeManualInput = createManualInputRouter();
+const logger = createLogger('agents:voice-agent');
 
 type IntentRoute = 'visual' | 'widget-lifecycle' | 'research' | 'livekit' | 'mcp' | 'general';
 type FastRouteType = 'timer' | 'sticky' | 'plain_text';
@@ -215,6 +218,16 @@ const intentClassifier = (text: string): IntentRoute => {
   return 'general';
 };
 
+const DO_NOTHING_RESULT = Object.freeze({
+  status: 'waiting_for_more_context',
+  effect: 'none',
+} as const);
+
+// Shared codecs for data-channel payloads; both are stateless, so one instance serves every
+// publish/receive instead of allocating per message.
+const dataEncoder = new TextEncoder();
+const dataDecoder = new TextDecoder();
+
 const QUICK_TIMER_PATTERN = /\b(timer|countdown|pomodoro)\b/i;
 const QUICK_STICKY_PATTERN = /\b(sticky(?:\s*note)?|post[-\s]?it|note\s+on\s+(?:the\s+)?canvas)\b/i;
 const QUICK_PLAIN_TEXT_PATTERN =
@@ -651,7 +664,7 @@ export default defineAgent({
       if (topic !== 'transcription') return;
       let message: any;
       try {
-        message = JSON.parse(new TextDecoder().decode(payload));
+        message = JSON.parse(dataDecoder.decode(payload));
       } catch (error) {
         logRealtimeError('failed to parse data payload', error);
         return;
@@ -810,14 +823,13 @@ export default defineAgent({
         inputAudioNoiseReduction,
         onTranscript: (payload) => {
           try {
-            // Fan out to all browsers for transcript UI.
-            job.room.localParticipant?.publishData(
-              new TextEncoder().encode(JSON.stringify(payload)),
-              {
+            // Fan out to all browsers for transcript UI without holding up orchestrator ingest.
+            void job.room.localParticipant
+              ?.publishData(dataEncoder.encode(JSON.stringify(payload)), {
                 reliable: payload.is_final,
                 topic: 'transcription',
-              },
-            );
+              })
+              .catch(() => { });
           } catch { }
 
           // Feed the orchestrator directly (the voice agent does not receive its own data packets).
@@ -1183,7 +1195,7 @@ Your only output is function calls. Never use plain text unless absolutely neces
           room: job.room.name || '',
           timestamp: Date.now(),
         };
-        job.room.localParticipant?.publishData(new TextEncoder().encode(JSON.stringify(payload)), {
+        job.room.localParticipant?.publishData(dataEncoder.encode(JSON.stringify(payload)), {
           reliable: true,
           topic: 'component_snapshot_request',
         });
@@ -2131,8 +2143,8 @@ Your only output is function calls. Never use plain text unless absolutely neces
         });
         return false;
       }
-      const payloadBytes = new TextEncoder().encode(JSON.stringify(entry.event));
-      console.debug('[VoiceAgent][debug] publish data', {
+      const payloadBytes = dataEncoder.encode(JSON.stringify(entry.event));
+      logger.debug('publish data', {
         tool: entry.event.payload.tool,
         reliable: entry.reliable,
         roomState: job.room.connectionState,
@@ -2161,7 +2173,7 @@ Your only output is function calls. Never use plain text unless absolutely neces
           return false;
         }
       }
-      console.log('[VoiceAgent] tool_call publish complete', {
+      logger.debug('tool_call publish complete', {
         tool: entry.event.payload.tool,
         reliable: entry.reliable,
       });
@@ -3074,7 +3086,7 @@ Your only output is function calls. Never use plain text unless absolutely neces
           providerPath: realtimeProviderPathForTool,
           providerSource: 'runtime_selected',
         });
-        console.debug('[VoiceAgent] dropping duplicate mutation by idempotency key', {
+        logger.debug('dropping duplicate mutation by idempotency key', {
           tool: toolName,
           idempotencyKey: orchestration.idempotencyKey,
           lockKey: orchestration.lockKey,
@@ -3417,9 +3429,9 @@ Your only output is function calls. Never use plain text unless absolutely neces
             typeof args.awaiting === 'string' && args.awaiting.trim().length > 0
               ? args.awaiting.trim()
               : undefined;
+          if (!reason && !awaiting) return DO_NOTHING_RESULT;
           return {
-            status: 'waiting_for_more_context',
-            effect: 'none',
+            ...DO_NOTHING_RESULT,
             ...(reason ? { reason } : {}),
             ...(awaiting ? { awaiting } : {}),
           };
@@ -4056,7 +4068,7 @@ Your only output is function calls. Never use plain text unless absolutely neces
     const publishAgentStatus = async (state: string, detail: Record<string, unknown>) => {
       try {
         await job.room.localParticipant?.publishData(
-          new TextEncoder().encode(
+          dataEncoder.encode(
             JSON.stringify({
               type: 'agent:status',
               state,
@@ -4299,7 +4311,7 @@ Your only output is function calls. Never use plain text unless absolutely neces
         serverGenerated,
       });
       if (dedupe.drop) {
-        console.log('[VoiceAgent] dropping duplicate transcription event', {
+        logger.debug('dropping duplicate transcription event', {
           reason: dedupe.reason,
           key: dedupe.key,
           participantId: allowSensitiveLogging ? participantId : '[redacted]',
@@ -4307,7 +4319,7 @@ Your only output is function calls. Never use plain text unless absolutely neces
         return;
       }
 
-      console.log('[VoiceAgent] DataReceived transcription', {
+      logger.debug('DataReceived transcription', {
         text: allowSensitiveLogging ? text : `[redacted:${text.length}]`,
         isManual,
         speaker: allowSensitiveLogging ? speaker : '[redacted]',
@@ -4315,6 +4327,15 @@ Your only output is function calls. Never use plain text unless absolutely neces
         participantName: allowSensitiveLogging ? participantName : '[redacted]',
         topic: 'transcription',
       });
+      // Filler-only automatic turns ("mm-hmm", "uh") never carry a canvas request; drop them before
+      // they replace the last prompt, open a new turn or prewarm route context.
+      if (
+        !isManual &&
+        (process.env.VOICE_AGENT_BACKCHANNEL_FILTER_ENABLED ?? 'true') !== 'false' &&
+        isBackchannelOnly(text)
+      ) {
+        return;
+      }
       lastUserPrompt = text;
       lastRequesterParticipantId =
         typeof participantId === 'string' && participantId.trim().length > 0
@@ -4347,8 +4368,8 @@ Your only output is function calls. Never use plain text unless absolutely neces
       }
       const attributedInput =
         speakerLabel && speakerLabel !== 'user' ? `${speakerLabel}: ${text}` : text;
-      console.log(
-        '[VoiceAgent] calling generateReply with userInput:',
+      logger.debug(
+        'calling generateReply with userInput:',
         allowSensitiveLogging ? attributedInput.slice(0, 160) : '[redacted]',
       );
       try {
@@ -4698,11 +4719,11 @@ Your only output is function calls. Never use plain text unless absolutely neces
 
     session.on((voice as any).AgentSessionEventTypes.FunctionToolsExecuted, async (event: any) => {
       const calls = event.functionCalls ?? [];
-      console.log('[VoiceAgent] FunctionToolsExecuted', {
+      logger.debug('FunctionToolsExecuted', {
         count: calls.length,
         callNames: calls.map((c) => c.name),
       });
-      console.log('[VoiceAgent] FunctionToolsExecuted raw', event);
+      logger.debug('FunctionToolsExecuted raw', event);
       for (const fnCall of calls) {
         try {
           const args = JSON.parse(fnCall.args || '{}') as Record<string, unknown>;
@@ -4928,7 +4949,7 @@ Your only output is function calls. Never use plain text unless absolutely neces
               });
             }
           }
-          console.debug('[VoiceAgent] FunctionToolsExecuted acknowledged', {
+          logger.debug('FunctionToolsExecuted acknowledged', {
             name: fnCall.name,
             id: fnCall.id,
             resolvedComponentId: args.componentId,
@@ -4971,7 +4992,7 @@ Your only output is function calls. Never use plain text unless absolutely neces
           manual: false,
           server_generated: true,
         };
-        await job.room.localParticipant?.publishData(new TextEncoder().encode(JSON.stringify(payload)), {
+        await job.room.localParticipant?.publishData(dataEncoder.encode(JSON.stringify(payload)), {
           reliable: event.isFinal,
           topic: 'transcription',
         });
@@ -5058,7 +5079,7 @@ Your only output is function calls. Never use plain text unless absolutely neces
         manual: false,
         server_generated: true,
       };
-      await job.room.localParticipant?.publishData(new TextEncoder().encode(JSON.stringify(payload)), {
+      await job.room.localParticipant?.publishData(dataEncoder.encode(JSON.stringify(payload)), {
         reliable: true,
         topic: 'transcription',
       });
@@ -5076,7 +5097,7 @@ Your only output is function calls. Never use plain text unless absolutely neces
 
     session.on(voice.AgentSessionEventTypes.ConversationItemAdded, async (event) => {
       if (allowSensitiveLogging) {
-        console.log('[VoiceAgent] ConversationItem FULL', {
+        logger.debug('ConversationItem FULL', {
           type: event.item.type,
           role: event.item.role,
           hasFunctionCall: !!(event.item as any).functionCall,
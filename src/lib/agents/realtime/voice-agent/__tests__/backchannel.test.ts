@@ -0,0 +1,28 @@
+import { isBackchannelOnly } from '../backchannel';
+
+describe('backchannel filter', () => {
+  it('matches filler-only utterances', () => {
+    const fillers = ['mm', 'Mmm.', 'hmm', 'Hmmm...', 'mhm', 'mm-hmm', 'Mm-hmm.', 'uh', 'um,'];
+    for (const text of [...fillers, 'uh-huh', 'Uh huh', 'um... uh']) {
+      expect(isBackchannelOnly(text)).toBe(true);
+    }
+  });
+
+  it('keeps short answers and real requests', () => {
+    const answers = ['yes', 'yeah', 'ok', 'okay', 'right', 'sure', 'huh?', ''];
+    for (const text of [...answers, 'um, start a timer', 'hmm make it bigger']) {
+      expect(isBackchannelOnly(text)).toBe(false);
+    }
+  });
+
+  it('rejects long near-miss inputs', () => {
+    const inputs = [
+      `${'m'.repeat(5_000)}x`,
+      `${'mm '.repeat(3_000)}x`,
+      `${'mm-hmm mm hmm '.repeat(2_000)}x`,
+    ];
+    for (const text of inputs) {
+      expect(isBackchannelOnly(text)).toBe(false);
+    }
+  });
+});
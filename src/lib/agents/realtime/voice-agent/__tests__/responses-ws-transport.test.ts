@@ -150,6 +150,10 @@ describe('ResponsesWebSocketTransport', () => {
     expect((sent[0]?.response as Record<string, unknown>)?.previous_response_id).toBeUndefined();
     expect((sent[1]?.response as Record<string, unknown>)?.previous_response_id).toBe('resp-1');
     expect((sent[2]?.response as Record<string, unknown>)?.previous_response_id).toBe('resp-2');
+    const firstCacheKey = (sent[0]?.response as Record<string, unknown>)?.prompt_cache_key;
+    expect(firstCacheKey).toEqual(expect.stringMatching(/^voice:[0-9a-f]{32}$/));
+    expect((sent[1]?.response as Record<string, unknown>)?.prompt_cache_key).toBe(firstCacheKey);
+    expect((sent[2]?.response as Record<string, unknown>)?.prompt_cache_key).not.toBe(firstCacheKey);
   });
 
   it('does not persist previous_response_id when store=false', async () => {
@@ -0,0 +1,14 @@
+// Filler tokens only (mm, hmm, mhm, mm-hmm, uh, um, uh-huh). Short answers such as "yes", "ok" or
+// "right" are deliberately excluded: they often answer a clarifying question from the agent.
+// Each token starts with a distinct prefix and tokens are joined by a required separator, so a
+// non-matching utterance fails in linear time instead of backtracking across token splits.
+const BACKCHANNEL_TOKEN = String.raw`(?:m(?:m+(?:-?h+m+)?|h+m+)|h+m+|u(?:h+(?:[-\s]?huh)?|m+))`;
+const BACKCHANNEL_ONLY_PATTERN = new RegExp(
+  String.raw`^${BACKCHANNEL_TOKEN}(?:[\s,.!?]+${BACKCHANNEL_TOKEN})*[\s,.!?]*$`,
+  'i',
+);
+
+/** True when a final transcript is nothing but conversational filler. */
+export function isBackchannelOnly(text: string): boolean {
+  return BACKCHANNEL_ONLY_PATTERN.test(text.trim());
+}
@@ -1,3 +1,4 @@
+import { createHash } from 'crypto';
 import WebSocket from 'ws';
 
 export type VoiceTransportTool = {
@@ -25,6 +26,7 @@ type ResponseCreatePayload = {
   tools: VoiceTransportTool[];
   toolChoice: 'required' | 'auto';
   previousResponseId: string | null;
+  promptCacheKey: string;
 };
 
 export type RunTurnInput = {
@@ -63,6 +65,36 @@ const safeStringify = (value: unknown): string => {
   }
 };
 
+// Instructions and tool schemas are identical across a session's turns; a stable key lets the
+// provider route those requests to the same prefix cache and skip re-prefilling them.
+const buildPromptCacheKey = (instructions: string, tools: VoiceTransportTool[]): string => {
+  const hash = createHash('sha256');
+  hash.update(instructions);
+  for (const tool of tools) {
+    hash.update('\u0000');
+    hash.update(tool.name);
+  }
+  return `voice:${hash.digest('hex').slice(0, 32)}`;
+};
+
+type ResponseFunctionTool = VoiceTransportTool & { type: 'function' };
+
+// The voice agent passes the same catalog array on every turn; map it to the wire shape once.
+const responseToolCache = new WeakMap<VoiceTransportTool[], ResponseFunctionTool[]>();
+
+const toResponseTools = (tools: VoiceTransportTool[]): ResponseFunctionTool[] => {
+  const cached = responseToolCache.get(tools);
+  if (cached) return cached;
+  const mapped = tools.map((tool) => ({
+    type: 'function' as const,
+    name: tool.name,
+    description: tool.description,
+    parameters: tool.parameters,
+  }));
+  responseToolCache.set(tools, mapped);
+  return mapped;
+};
+
 const normalizeTextInput = (value?: string): string => {
   const next = (value || '').trim();
   return next.length > 0 ? next : 'continue';
@@ -298,13 +330,9 @@ export class ResponsesWebSocketTransport implements VoiceModelTransport {
           model: this.model,
           instructions: payload.instructions,
           input: payload.input,
-          tools: payload.tools.map((tool) => ({
-            type: 'function',
-            name: tool.name,
-            description: tool.description,
-            parameters: tool.parameters,
-          })),
+          tools: toResponseTools(payload.tools),
           tool_choice: payload.toolChoice,
+          prompt_cache_key: payload.promptCacheKey,
           ...(payload.previousResponseId ? { previous_response_id: payload.previousResponseId } : {}),
           ...(this.store ? {} : { store: false }),
         },
@@ -325,6 +353,7 @@ export class ResponsesWebSocketTransport implements VoiceModelTransport {
     let executed = 0;
     let latestResponseId: string | null = null;
     let previousResponseId = this.previousResponseId;
+    const promptCacheKey = buildPromptCacheKey(input.instructions, input.tools);
 
     const firstInput: Array<Record<string, unknown>> = [
       {
@@ -342,6 +371,7 @@ export class ResponsesWebSocketTransport implements VoiceModelTransport {
           tools: input.tools,
           toolChoice: input.toolChoice ?? 'required',
           previousResponseId,
+          promptCacheKey,
         });
         latestResponseId = extractResponseId(response);
         if (latestResponseId) {
@@ -248,6 +248,41 @@ export const normalizeSpecInput = (raw: unknown): JsonObject => {
   return {};
 };
 
+// Token sets for normalizeComponentPatch; built once instead of re-allocating arrays per patch.
+const TRUTHY_PATCH_TOKENS = new Set(['true', 'yes', 'start', 'run', 'running', 'resume', 'play', 'on', '1']);
+const FALSY_PATCH_TOKENS = new Set(['false', 'no', 'stop', 'stopped', 'pause', 'paused', 'halt', 'off', '0']);
+const RUNNING_STATE_LABELS = new Set([
+  'run',
+  'running',
+  'start',
+  'started',
+  'resume',
+  'resumed',
+  'play',
+  'playing',
+  'active',
+]);
+const STOPPED_STATE_LABELS = new Set([
+  'paused',
+  'pause',
+  'stop',
+  'stopped',
+  'halt',
+  'idle',
+  'ready',
+  'standby',
+]);
+const FINISHED_STATE_LABELS = new Set([
+  'finished',
+  'complete',
+  'completed',
+  'done',
+  'expired',
+  "time's up",
+  'time up',
+  'timeup',
+]);
+
 export const normalizeComponentPatch = (patch: JsonObject, fallbackSeconds: number): JsonObject => {
   const next: JsonObject = { ...patch };
   const timestamp = Date.now();
@@ -262,10 +297,10 @@ export const normalizeComponentPatch = (patch: JsonObject, fallbackSeconds: numb
     if (typeof value === 'string') {
       const normalized = value.trim().toLowerCase();
       if (!normalized) return undefined;
-      if (['true', 'yes', 'start', 'run', 'running', 'resume', 'play', 'on', '1'].includes(normalized)) {
+      if (TRUTHY_PATCH_TOKENS.has(normalized)) {
         return true;
       }
-      if (['false', 'no', 'stop', 'stopped', 'pause', 'paused', 'halt', 'off', '0'].includes(normalized)) {
+      if (FALSY_PATCH_TOKENS.has(normalized)) {
         return false;
       }
     }
@@ -431,21 +466,11 @@ export const normalizeComponentPatch = (patch: JsonObject, fallbackSeconds: numb
         }
       }
     };
-    if (
-      ['run', 'running', 'start', 'started', 'resume', 'resumed', 'play', 'playing', 'active'].includes(
-        stateLabel,
-      )
-    ) {
+    if (RUNNING_STATE_LABELS.has(stateLabel)) {
       markRunning();
-    } else if (
-      ['paused', 'pause', 'stop', 'stopped', 'halt', 'idle', 'ready', 'standby'].includes(stateLabel)
-    ) {
+    } else if (STOPPED_STATE_LABELS.has(stateLabel)) {
       markStopped(false);
-    } else if (
-      ['finished', 'complete', 'completed', 'done', 'expired', "time's up", 'time up', 'timeup'].includes(
-        stateLabel,
-      )
-    ) {
+    } else if (FINISHED_STATE_LABELS.has(stateLabel)) {
       markStopped(true);
     }
   }
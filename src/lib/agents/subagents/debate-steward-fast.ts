@@ -12,6 +12,9 @@ import {
   recordModelIoEvent,
   recordToolIoEvent,
 } from '@/lib/agents/shared/replay-telemetry';
+import { createLogger } from '@/lib/logging';
+
+const logger = createLogger('agents:debate-steward-fast');
 
 const buildDebateFastTrace = (model: string) => ({
   provider: 'cerebras' as const,
@@ -205,7 +208,7 @@ export async function runDebateScorecardStewardFast(params: {
     throw new Error('DebateStewardFast requires CEREBRAS_API_KEY');
   }
 
-  console.log('[DebateStewardFast] start', { room, componentId, intent, topic });
+  logger.info('start', { room, componentId, intent, topic });
 
   const record = await getDebateScorecard(room, componentId);
   const currentState = record.state;
@@ -320,7 +323,7 @@ export async function runDebateScorecardStewardFast(params: {
       updatedState = attemptParse(stripped);
     }
     if (!updatedState) {
-      console.error('[DebateStewardFast] Failed to parse updated state JSON');
+      logger.error('failed to parse updated state JSON');
       recordToolIoEvent({
         source: 'fast_debate_steward',
         eventType: 'state_commit',
@@ -400,7 +403,7 @@ export async function runDebateScorecardStewardFast(params: {
       latencyMs: Date.now() - start,
     });
 
-    console.log('[DebateStewardFast] complete', {
+    logger.info('complete', {
       room,
       componentId,
       newVersion: committed.version,
@@ -431,7 +434,7 @@ export async function runDebateScorecardStewardFast(params: {
     };
 
   } catch (error) {
-    console.error('[DebateStewardFast] error', { room, componentId, error });
+    logger.error('error', { room, componentId, error });
     recordModelIoEvent({
       source: 'fast_debate_steward',
       eventType: 'model_call',
@@ -2,14 +2,17 @@ import { getCerebrasClient, getModelForSteward, isFastStewardReady } from '../fa
 import { getFlowchartDoc, getTranscriptWindow, commitFlowchartDoc, getContextDocuments, formatContextDocuments } from '../shared/supabase-context';
 import { extractFirstToolCall, parseToolArgumentsResult } from './fast-steward-response';
 import { resolveFastStewardModel } from '@/lib/agents/control-plane/fast-model';
+import { createLogger } from '@/lib/logging';
 
 const getFlowchartFastModel = () => getModelForSteward('FLOWCHART_STEWARD_FAST_MODEL');
 
 export const flowchartStewardFastReady = isFastStewardReady();
 
+const logger = createLogger('agents:flowchart-steward-fast');
+
 const logFastMetric = <T extends Record<string, unknown>>(label: string, payload: T) => {
   try {
-    console.log(`[StewardFAST][Metrics] ${label}`, { ts: new Date().toISOString(), ...payload });
+    logger.info(`[Metrics] ${label}`, { ts: new Date().toISOString(), ...payload });
   } catch { }
 };
 
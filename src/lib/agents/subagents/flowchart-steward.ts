@@ -1,10 +1,20 @@
 import { Agent, tool, run } from '@openai/agents';
 import { z } from 'zod';
 import { getFlowchartDoc, commitFlowchartDoc, getTranscriptWindow } from '../shared/supabase-context';
+import { createLogger } from '@/lib/logging';
+
+const logger = createLogger('agents:flowchart-steward');
 
 const logWithTs = <T extends Record<string, unknown>>(label: string, payload: T) => {
   try {
-    console.log(label, { ts: new Date().toISOString(), ...payload });
+    logger.info(label, { ts: new Date().toISOString(), ...payload });
+  } catch {}
+};
+
+// Warnings bypass the level-gated logger so they still print in production.
+const warnWithTs = <T extends Record<string, unknown>>(label: string, payload: T) => {
+  try {
+    console.warn(label, { ts: new Date().toISOString(), ...payload });
   } catch {}
 };
 
@@ -159,7 +169,7 @@ export const commit_flowchart = tool({
               } catch {}
             } catch (err) {
               try {
-                logWithTs('⚠️ [Steward] broadcast failed', {
+                warnWithTs('⚠️ [Steward] broadcast failed', {
                   room,
                   docId,
                   version: res.version,
@@ -172,7 +182,7 @@ export const commit_flowchart = tool({
           })();
         } else {
           try {
-            logWithTs('⚠️ [Steward] broadcast URL unavailable, skipping LiveKit patch', {
+            warnWithTs('⚠️ [Steward] broadcast URL unavailable, skipping LiveKit patch', {
               room,
               docId,
             });
@@ -183,7 +193,7 @@ export const commit_flowchart = tool({
         if (attempt === 0 && error instanceof Error && error.message === 'CONFLICT') {
           const latest = await getFlowchartDoc(room, docId);
           try {
-            logWithTs('⚠️ [Steward] commit conflict', {
+            warnWithTs('⚠️ [Steward] commit conflict', {
               room,
               docId,
               attemptedPrev: expectedPrev,
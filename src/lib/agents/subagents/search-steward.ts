@@ -105,26 +105,30 @@ async function runGeneralSearch(rawParams: JsonObject): Promise<SearchStewardRes
       rawParams.sharedUnlockSessionId.trim()
         ? rawParams.sharedUnlockSessionId.trim()
         : null;
-    const resolvedControl: ResolvedModelControl = await resolveModelControl({
-      task: 'search.general',
-      room: parsed.room,
-      userId: requesterUserId ?? undefined,
-      billingUserId: billingUserId ?? undefined,
-      includeUserScope: true,
-    }).catch(() => ({
-      effective: { models: {}, knobs: {} },
-      sources: [],
-      applyModes: {},
-      fieldSources: {},
-      resolvedAt: new Date().toISOString(),
-      configVersion: 'env-fallback',
-    }));
+    const byokUserId = BYOK_ENABLED ? (billingUserId || requesterUserId) : null;
+    // Model-control resolution and the BYOK key lookup are independent round-trips; run them
+    // together so the search doesn't wait on their sum.
+    const [resolvedControl, byokKey]: [ResolvedModelControl, string | null] = await Promise.all([
+      resolveModelControl({
+        task: 'search.general',
+        room: parsed.room,
+        userId: requesterUserId ?? undefined,
+        billingUserId: billingUserId ?? undefined,
+        includeUserScope: true,
+      }).catch(() => ({
+        effective: { models: {}, knobs: {} },
+        sources: [],
+        applyModes: {},
+        fieldSources: {},
+        resolvedAt: new Date().toISOString(),
+        configVersion: 'env-fallback',
+      })),
+      byokUserId
+        ? getDecryptedUserModelKey({ userId: byokUserId, provider: 'openai' })
+        : Promise.resolve(null),
+    ]);
     const resolvedSearchModel = resolvedControl.effective.models?.searchModel;
     const resolvedSearchKnobs = resolvedControl.effective.knobs?.search;
-    const byokUserId = BYOK_ENABLED ? (billingUserId || requesterUserId) : null;
-    const byokKey = byokUserId
-      ? await getDecryptedUserModelKey({ userId: byokUserId, provider: 'openai' })
-      : null;
     const sharedKey =
       !byokKey && sharedUnlockSessionId && requesterUserId
         ? await resolveSharedKeyBySession({
@@ -0,0 +1,72 @@
+/** @jest-environment node */
+
+const mockCreate = jest.fn();
+
+jest.mock('@/lib/agents/fast-steward-config', () => ({
+  isFastStewardReady: jest.fn(() => true),
+  getModelForSteward: jest.fn(() => 'debug/fake'),
+  getCerebrasClient: jest.fn(() => ({ chat: { completions: { create: mockCreate } } })),
+}));
+
+jest.mock('@/lib/agents/control-plane/fast-model', () => ({
+  resolveFastStewardModel: jest.fn(async () => ({ model: 'debug/fake' })),
+}));
+
+import { runYouTubeSteward } from './youtube-steward';
+
+const commitAction = (args: Record<string, unknown>) => ({
+  choices: [
+    {
+      message: {
+        tool_calls: [{ function: { name: 'commit_action', arguments: JSON.stringify(args) } }],
+      },
+    },
+  ],
+});
+
+describe('runYouTubeSteward decision cache', () => {
+  beforeEach(() => {
+    mockCreate.mockReset();
+    mockCreate.mockResolvedValue(
+      commitAction({
+        kind: 'search',
+        mcpToolName: 'searchVideos',
+        mcpToolArgs: JSON.stringify({ query: 'lofi beats', maxResults: 5 }),
+      }),
+    );
+  });
+
+  it('reuses the decision for a repeated instruction on the same video', async () => {
+    const context = { currentVideo: { videoId: 'video-a', title: 'A' } };
+    const first = await runYouTubeSteward({ instruction: 'Play lofi beats', context });
+    const second = await runYouTubeSteward({ instruction: '  play   LOFI beats ', context });
+
+    expect(mockCreate).toHaveBeenCalledTimes(1);
+    expect(second).toEqual(first);
+    expect(second.mcpTool).toEqual({
+      name: 'searchVideos',
+      args: { query: 'lofi beats', maxResults: 5 },
+    });
+  });
+
+  it('returns clones so callers cannot corrupt the cached action', async () => {
+    const context = { currentVideo: { videoId: 'video-b', title: 'B' } };
+    const first = await runYouTubeSteward({ instruction: 'show lofi beats', context });
+    first.kind = 'noOp';
+    if (first.mcpTool) first.mcpTool.args.query = 'mutated';
+
+    const second = await runYouTubeSteward({ instruction: 'show lofi beats', context });
+
+    expect(mockCreate).toHaveBeenCalledTimes(1);
+    expect(second.kind).toBe('search');
+    expect(second.mcpTool?.args.query).toBe('lofi beats');
+  });
+
+  it('misses the cache when the current video changes', async () => {
+    const instruction = 'find similar lofi beats';
+    await runYouTubeSteward({ instruction, context: { currentVideo: { videoId: 'video-c' } } });
+    await runYouTubeSteward({ instruction, context: { currentVideo: { videoId: 'video-d' } } });
+
+    expect(mockCreate).toHaveBeenCalledTimes(2);
+  });
+});
@@ -1,6 +1,10 @@
 import { getCerebrasClient, getModelForSteward, isFastStewardReady } from '../fast-steward-config';
 import { extractFirstToolCall, parseToolArgumentsResult } from './fast-steward-response';
 import { resolveFastStewardModel } from '@/lib/agents/control-plane/fast-model';
+import { createLogger } from '@/lib/logging';
+import { createTtlCache, parseTtlSecEnv } from '@/lib/server/ttl-cache';
+
+const logger = createLogger('agents:youtube-steward');
 
 const getYouTubeFastModel = () => getModelForSteward('YOUTUBE_STEWARD_FAST_MODEL');
 
@@ -57,21 +61,28 @@ type YouTubeAction = {
   mcpTool: { name: string; args: Record<string, unknown> } | null;
 };
 
+// Voice turns often repeat the same request ("play the next one", "show trending music");
+// exact repeats within a short window reuse the previous decision instead of another model hop.
+const decisionCache = createTtlCache<YouTubeAction>({
+  ttlMs: parseTtlSecEnv(process.env.YOUTUBE_STEWARD_CACHE_TTL_SEC, 120),
+  maxEntries: 200,
+});
+
+const cloneAction = (action: YouTubeAction): YouTubeAction => ({
+  ...action,
+  mcpTool: action.mcpTool ? { name: action.mcpTool.name, args: { ...action.mcpTool.args } } : null,
+});
+
 export async function runYouTubeSteward(params: { instruction: string; context?: any }): Promise<YouTubeAction> {
   const { instruction, context } = params;
   const room =
     context && typeof context === 'object' && typeof (context as { room?: unknown }).room === 'string'
       ? (context as { room: string }).room
       : undefined;
-  const { model: CEREBRAS_MODEL } = await resolveFastStewardModel({
-    steward: 'youtube',
-    stewardEnvVar: 'YOUTUBE_STEWARD_FAST_MODEL',
-    room,
-    task: 'youtube.fast',
-  }).catch(() => ({ model: getYouTubeFastModel() }));
 
   // The FAST YouTube steward uses Cerebras; if it's not configured we return a best-effort heuristic
-  // so the rest of the system can keep running.
+  // so the rest of the system can keep running. Check this before resolving the model so the
+  // fallback path doesn't pay for a control-plane lookup it never uses.
   if (!isFastStewardReady()) {
     return {
       kind: 'search',
@@ -80,6 +91,25 @@ export async function runYouTubeSteward(params: { instruction: string; context?:
     };
   }
 
+  const { model: CEREBRAS_MODEL } = await resolveFastStewardModel({
+    steward: 'youtube',
+    stewardEnvVar: 'YOUTUBE_STEWARD_FAST_MODEL',
+    room,
+    task: 'youtube.fast',
+  }).catch(() => ({ model: getYouTubeFastModel() }));
+
+  const currentVideoId =
+    typeof context?.currentVideo?.videoId === 'string' ? context.currentVideo.videoId : '';
+  const decisionKey = [
+    CEREBRAS_MODEL,
+    currentVideoId,
+    instruction.trim().replace(/\s+/g, ' ').toLowerCase(),
+  ].join('|');
+  const cachedDecision = decisionCache.get(decisionKey);
+  if (cachedDecision) {
+    return cloneAction(cachedDecision);
+  }
+
   const contextInfo = context?.currentVideo
     ? `Current video: ${context.currentVideo.title} (${context.currentVideo.videoId})`
     : '';
@@ -98,7 +128,9 @@ export async function runYouTubeSteward(params: { instruction: string; context?:
       model: CEREBRAS_MODEL,
       messages,
       tools,
-      tool_choice: 'auto',
+      // commit_action is the only tool and the only useful output; requiring it skips free-text
+      // replies that would fall through to the heuristic search below.
+      tool_choice: 'required',
     });
 
     const toolCall = extractFirstToolCall(response);
@@ -131,13 +163,15 @@ export async function runYouTubeSteward(params: { instruction: string; context?:
         }
       }
 
-      return {
+      const action: YouTubeAction = {
         kind: typeof args.kind === 'string' ? args.kind : 'noOp',
         videoId: typeof args.videoId === 'string' ? args.videoId : undefined,
         channelId: typeof args.channelId === 'string' ? args.channelId : undefined,
         reason: typeof args.reason === 'string' ? args.reason : undefined,
         mcpTool,
       };
+      decisionCache.set(decisionKey, action);
+      return cloneAction(action);
     }
 
     return {
@@ -145,7 +179,7 @@ export async function runYouTubeSteward(params: { instruction: string; context?:
       mcpTool: { name: 'searchVideos', args: { query: instruction, maxResults: 5 } },
     };
   } catch (error) {
-    console.error('[YouTubeSteward] Error:', error);
+    logger.error('instruction processing failed', error);
     return { kind: 'noOp', reason: 'Error processing instruction', mcpTool: null };
   }
 }
@@ -0,0 +1,73 @@
+/** @jest-environment node */
+
+const mockCreate = jest.fn();
+
+jest.mock('openai', () => ({
+  __esModule: true,
+  default: jest.fn().mockImplementation(() => ({ responses: { create: mockCreate } })),
+}));
+
+import { performWebSearch } from './web-search';
+
+describe('performWebSearch', () => {
+  const originalBreaker = process.env.COST_CIRCUIT_BREAKER_ENABLED;
+
+  beforeEach(() => {
+    mockCreate.mockReset();
+    process.env.COST_CIRCUIT_BREAKER_ENABLED = 'true';
+  });
+
+  afterAll(() => {
+    if (typeof originalBreaker === 'undefined') {
+      delete process.env.COST_CIRCUIT_BREAKER_ENABLED;
+    } else {
+      process.env.COST_CIRCUIT_BREAKER_ENABLED = originalBreaker;
+    }
+  });
+
+  it('coalesces concurrent identical searches into one provider call and one budget unit', async () => {
+    let resolveResponse: (value: unknown) => void = () => {};
+    mockCreate.mockReturnValue(
+      new Promise((resolve) => {
+        resolveResponse = resolve;
+      }),
+    );
+
+    const args = { query: 'coalesced claim', maxResults: 1 };
+    const options = { apiKey: 'test-key', model: 'test-search-model', costPerMinuteLimit: 1 };
+    const first = performWebSearch(args, options);
+    const second = performWebSearch(args, options);
+
+    resolveResponse({
+      id: 'resp_1',
+      output_text: JSON.stringify({
+        summary: 'summary',
+        hits: [{ title: 'Source', url: 'https://example.com/a', snippet: 'Evidence snippet' }],
+      }),
+    });
+
+    const [a, b] = await Promise.all([first, second]);
+    expect(mockCreate).toHaveBeenCalledTimes(1);
+    expect(a.hits[0]?.url).toBe('https://example.com/a');
+    expect(b.hits).toEqual(a.hits);
+  });
+
+  it('keeps 1200 output tokens as the floor and scales up for larger requests', async () => {
+    mockCreate.mockResolvedValue({
+      id: 'resp_tokens',
+      output_text: JSON.stringify({
+        summary: 'summary',
+        hits: [{ title: 'Source', url: 'https://example.com/b', snippet: 'Evidence snippet' }],
+      }),
+    });
+    const options = { apiKey: 'test-key', model: 'test-search-model', costPerMinuteLimit: 100 };
+
+    for (const maxResults of [1, 3, 6]) {
+      await performWebSearch({ query: `token budget ${maxResults}`, maxResults }, options);
+    }
+
+    expect(mockCreate.mock.calls.map(([request]) => request.max_output_tokens)).toEqual([
+      1200, 1200, 1650,
+    ]);
+  });
+});
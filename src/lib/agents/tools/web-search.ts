@@ -1,6 +1,7 @@
 import crypto from 'node:crypto';
 import OpenAI from 'openai';
 import { z } from 'zod';
+import { createKeyedClientCache } from '@/lib/server/keyed-client-cache';
 import { consumeBudget, isCostCircuitBreakerEnabled } from '@/lib/server/traffic-guards';
 import { getRuntimeModelKey } from '@/lib/agents/shared/model-runtime-context';
 
@@ -53,35 +54,58 @@ export type WebSearchResponse = {
   };
 };
 
-const cachedClients = new Map<string, OpenAI>();
 const evidenceCache = new Map<string, { response: WebSearchResponse; expiresAt: number }>();
+// Concurrent fact-checks for the same claim (several participants, replayed steward tasks) share
+// one provider call instead of each spending a web_search round-trip.
+const inflightSearches = new Map<string, Promise<WebSearchResponse>>();
 const MAX_CACHED_OPENAI_CLIENTS = Math.max(
   4,
   Number.parseInt(process.env.WEB_SEARCH_CLIENT_CACHE_MAX ?? '32', 10) || 32,
 );
+const getCachedClient = createKeyedClientCache(
+  (apiKey) => new OpenAI({ apiKey }),
+  MAX_CACHED_OPENAI_CLIENTS,
+);
 const FACT_CHECK_CACHE_TTL_MS = Math.max(
   1_000,
   Number(process.env.FACT_CHECK_CACHE_TTL_SEC ?? 900) * 1000,
 );
 
+const WEB_SEARCH_SYSTEM_PROMPT = `You are a JSON API for web evidence used in debate fact-checking.
+
+You MUST call web_search to gather live evidence.
+
+Return STRICT JSON only (no markdown, no backticks, no commentary) with shape:
+{
+  "summary": string,
+  "hits": [
+    {
+      "title": string,
+      "url": string,
+      "snippet": string,
+      "publishedAt": string | null,
+      "source": string | null
+    }
+  ]
+}
+
+Rules:
+- hits.length must equal Max results.
+- summary must be <= 280 characters.
+- snippet must be <= 180 characters and state concrete, checkable facts relevant to the query.
+- url must be a direct https:// URL (not a generic homepage when avoidable).
+- Prefer authoritative sources.`;
+
+// Reasoning and web_search tool output count toward max_output_tokens, so the fixed 1200 that
+// default (3-hit) requests always used stays the floor; larger requests get headroom per extra hit.
+const resolveMaxOutputTokens = (maxResults: number) => 1200 + Math.max(0, maxResults - 3) * 150;
+
 function getClient(explicitApiKey?: string): OpenAI {
   const apiKey = explicitApiKey?.trim() || getRuntimeModelKey('OPENAI_API_KEY') || process.env.OPENAI_API_KEY;
   if (!apiKey || !apiKey.trim()) {
     throw new Error('OPENAI_API_KEY missing for web search');
   }
-  const normalized = apiKey.trim();
-  const cacheKey = crypto.createHash('sha256').update(normalized).digest('hex');
-  const cached = cachedClients.get(cacheKey);
-  if (cached) return cached;
-  const client = new OpenAI({ apiKey: normalized });
-  cachedClients.set(cacheKey, client);
-  if (cachedClients.size > MAX_CACHED_OPENAI_CLIENTS) {
-    const oldest = cachedClients.keys().next().value;
-    if (typeof oldest === 'string') {
-      cachedClients.delete(oldest);
-    }
-  }
-  return client;
+  return getCachedClient(apiKey.trim());
 }
 
 function hashId(value: string): string {
@@ -208,6 +232,18 @@ export async function performWebSearch(
     process.env.CANVAS_STEWARD_SEARCH_MODEL ||
     process.env.DEBATE_STEWARD_SEARCH_MODEL ||
     'gpt-5-mini';
+  const evidenceCacheKey = buildEvidenceCacheKey(parsed, model, options.configVersion);
+  const cacheKey = stringifyEvidenceCacheKey(evidenceCacheKey);
+  const cached = evidenceCache.get(cacheKey);
+  if (cached && cached.expiresAt > Date.now()) {
+    return { ...cached.response };
+  }
+  // Cache hits and coalesced duplicates make no provider call, so only the leader is charged.
+  const pending = inflightSearches.get(cacheKey);
+  if (pending) {
+    return { ...(await pending) };
+  }
+
   if (isCostCircuitBreakerEnabled()) {
     const searchBudgetPerMinute = Math.max(
       1,
@@ -220,38 +256,21 @@ export async function performWebSearch(
       throw error;
     }
   }
-  const evidenceCacheKey = buildEvidenceCacheKey(parsed, model, options.configVersion);
-  const cacheKey = stringifyEvidenceCacheKey(evidenceCacheKey);
-  const cached = evidenceCache.get(cacheKey);
-  if (cached && cached.expiresAt > Date.now()) {
-    return { ...cached.response };
-  }
 
-  const systemPrompt = `You are a JSON API for web evidence used in debate fact-checking.
-
-You MUST call web_search to gather live evidence.
-
-Return STRICT JSON only (no markdown, no backticks, no commentary) with shape:
-{
-  "summary": string,
-  "hits": [
-    {
-      "title": string,
-      "url": string,
-      "snippet": string,
-      "publishedAt": string | null,
-      "source": string | null
-    }
-  ]
+  const request = searchEvidence(client, parsed, model, cacheKey, options).finally(() => {
+    inflightSearches.delete(cacheKey);
+  });
+  inflightSearches.set(cacheKey, request);
+  return request;
 }
 
-Rules:
-- hits.length must equal Max results.
-- summary must be <= 280 characters.
-- snippet must be <= 180 characters and state concrete, checkable facts relevant to the query.
-- url must be a direct https:// URL (not a generic homepage when avoidable).
-- Prefer authoritative sources.`;
-
+async function searchEvidence(
+  client: OpenAI,
+  parsed: WebSearchArgs,
+  model: string,
+  cacheKey: string,
+  options: { configVersion?: string; cacheTtlMs?: number },
+): Promise<WebSearchResponse> {
   const userPrompt = `Query: ${parsed.query}
 Max results: ${parsed.maxResults}
 Instructions:
@@ -263,11 +282,11 @@ Instructions:
     model,
     reasoning: { effort: 'low' },
     input: [
-      { role: 'system', content: systemPrompt },
+      { role: 'system', content: WEB_SEARCH_SYSTEM_PROMPT },
       { role: 'user', content: userPrompt },
     ],
     tools: [{ type: 'web_search' }],
-    max_output_tokens: 1200,
+    max_output_tokens: resolveMaxOutputTokens(parsed.maxResults),
   });
 
   const structured = (() => {
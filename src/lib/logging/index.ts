@@ -50,18 +50,27 @@ const getRuntimeLogLevel = (): LogLevel => {
   return process.env.NODE_ENV === 'development' ? 'warn' : 'error';
 };
 
+// Debug namespaces are checked on every filtered debug/info call; only re-split the CSV when the
+// raw setting changes (it can be toggled at runtime via localStorage or env in tests).
+let debugNamespacesSource: string | null = null;
+let debugNamespaces = new Set<string>();
+
 const getDebugNamespaces = (): Set<string> => {
-  const values: string[] = [];
+  let source = '';
   try {
     if (typeof window !== 'undefined') {
-      values.push(...listFromCsv(window.localStorage.getItem('present:debugNamespaces')));
-      values.push(...listFromCsv(process.env.NEXT_PUBLIC_DEBUG_NAMESPACES));
+      source = `${window.localStorage.getItem('present:debugNamespaces') ?? ''},${
+        process.env.NEXT_PUBLIC_DEBUG_NAMESPACES ?? ''
+      }`;
     } else {
-      values.push(...listFromCsv(process.env.DEBUG_NAMESPACES));
-      values.push(...listFromCsv(process.env.NEXT_PUBLIC_DEBUG_NAMESPACES));
+      source = `${process.env.DEBUG_NAMESPACES ?? ''},${process.env.NEXT_PUBLIC_DEBUG_NAMESPACES ?? ''}`;
     }
   } catch {}
-  return new Set(values);
+  if (source !== debugNamespacesSource) {
+    debugNamespacesSource = source;
+    debugNamespaces = new Set(listFromCsv(source));
+  }
+  return debugNamespaces;
 };
 
 const shouldLog = (namespace: string, level: LogLevel): boolean => {
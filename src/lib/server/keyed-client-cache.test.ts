@@ -0,0 +1,18 @@
+import { createKeyedClientCache } from '@/lib/server/keyed-client-cache';
+
+describe('keyed client cache', () => {
+  it('reuses one client per key and evicts the oldest past capacity', () => {
+    const create = jest.fn((apiKey: string) => ({ apiKey }));
+    const getClient = createKeyedClientCache(create, 2);
+
+    const a = getClient('key-a');
+    expect(getClient('key-a')).toBe(a);
+    getClient('key-b');
+    getClient('key-c');
+
+    expect(create).toHaveBeenCalledTimes(3);
+    expect(getClient('key-c')).toEqual({ apiKey: 'key-c' });
+    expect(getClient('key-a')).not.toBe(a);
+    expect(create).toHaveBeenCalledTimes(4);
+  });
+});
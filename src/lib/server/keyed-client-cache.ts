@@ -0,0 +1,28 @@
+/**
+ * One SDK client (and its keep-alive agent) per API key, shared by routes and tools that accept
+ * BYOK keys. Keys are hashed so secrets are not held as map keys; past `maxEntries` the oldest
+ * client is dropped (Map iteration order is insertion order).
+ */
+
+import crypto from 'node:crypto';
+
+export function createKeyedClientCache<C>(
+  create: (apiKey: string) => C,
+  maxEntries: number,
+): (apiKey: string) => C {
+  const clients = new Map<string, C>();
+  return (apiKey) => {
+    const cacheKey = crypto.createHash('sha256').update(apiKey).digest('hex');
+    const cached = clients.get(cacheKey);
+    if (cached) return cached;
+    const client = create(apiKey);
+    clients.set(cacheKey, client);
+    if (clients.size > maxEntries) {
+      const oldest = clients.keys().next().value;
+      if (typeof oldest === 'string') {
+        clients.delete(oldest);
+      }
+    }
+    return client;
+  };
+}
@@ -0,0 +1,49 @@
+import { createTtlCache, parseTtlSecEnv } from '@/lib/server/ttl-cache';
+
+describe('ttl cache', () => {
+  it('returns values until they expire and then drops them', () => {
+    const start = 1_000_000;
+    const cache = createTtlCache<string>({ ttlMs: 1_000, maxEntries: 10 });
+    cache.set('a', 'alpha', undefined, start);
+
+    expect(cache.get('a', start + 999)).toBe('alpha');
+    expect(cache.get('a', start + 1_000)).toBeNull();
+    expect(cache.size).toBe(0);
+  });
+
+  it('honors per-entry ttl overrides and skips writes with a non-positive ttl', () => {
+    const start = 2_000_000;
+    const cache = createTtlCache<string>({ ttlMs: 10_000, maxEntries: 10 });
+    cache.set('short', 'value', 100, start);
+    cache.set('never', 'value', 0, start);
+
+    expect(cache.get('short', start + 50)).toBe('value');
+    expect(cache.get('short', start + 100)).toBeNull();
+    expect(cache.get('never', start)).toBeNull();
+  });
+
+  it('sweeps expired entries before evicting the oldest live ones', () => {
+    const start = 3_000_000;
+    const cache = createTtlCache<number>({ ttlMs: 1_000, maxEntries: 2 });
+    cache.set('expired', 1, 10, start);
+    cache.set('live-1', 2, undefined, start);
+    cache.set('live-2', 3, undefined, start + 20);
+
+    expect(cache.size).toBe(2);
+    expect(cache.get('live-1', start + 20)).toBe(2);
+    expect(cache.get('live-2', start + 20)).toBe(3);
+
+    cache.set('live-3', 4, undefined, start + 30);
+    expect(cache.get('live-1', start + 30)).toBeNull();
+    expect(cache.get('live-2', start + 30)).toBe(3);
+    expect(cache.get('live-3', start + 30)).toBe(4);
+  });
+
+  it('parses ttl seconds from env with a fallback', () => {
+    expect(parseTtlSecEnv(undefined, 120)).toBe(120_000);
+    expect(parseTtlSecEnv('30', 120)).toBe(30_000);
+    expect(parseTtlSecEnv('0', 120)).toBe(0);
+    expect(parseTtlSecEnv('-5', 120)).toBe(0);
+    expect(parseTtlSecEnv('nope', 120)).toBe(120_000);
+  });
+});
@@ -0,0 +1,62 @@
+/**
+ * Small in-process TTL cache shared by the route and steward caches.
+ *
+ * Entries expire lazily on read. When the map grows past `maxEntries`, expired entries are swept
+ * first and then the oldest insertions are dropped (Map iteration order is insertion order).
+ */
+
+export type TtlCache<V> = {
+  get: (key: string, now?: number) => V | null;
+  set: (key: string, value: V, ttlMs?: number, now?: number) => void;
+  delete: (key: string) => void;
+  clear: () => void;
+  readonly size: number;
+};
+
+/** Read a TTL in seconds from env, returning milliseconds; 0 disables caching. */
+export function parseTtlSecEnv(value: string | undefined, fallbackSec: number): number {
+  const parsed = Number(value ?? fallbackSec);
+  return Number.isFinite(parsed) ? Math.max(0, parsed * 1000) : fallbackSec * 1000;
+}
+
+export function createTtlCache<V>(options: { ttlMs: number; maxEntries: number }): TtlCache<V> {
+  const entries = new Map<string, { value: V; expiresAt: number }>();
+
+  const prune = (now: number) => {
+    if (entries.size <= options.maxEntries) return;
+    for (const [key, entry] of entries) {
+      if (entry.expiresAt <= now) entries.delete(key);
+    }
+    while (entries.size > options.maxEntries) {
+      const oldest = entries.keys().next().value;
+      if (typeof oldest !== 'string') break;
+      entries.delete(oldest);
+    }
+  };
+
+  return {
+    get: (key, now = Date.now()) => {
+      const entry = entries.get(key);
+      if (!entry) return null;
+      if (entry.expiresAt <= now) {
+        entries.delete(key);
+        return null;
+      }
+      return entry.value;
+    },
+    set: (key, value, ttlMs = options.ttlMs, now = Date.now()) => {
+      if (ttlMs <= 0) return;
+      entries.set(key, { value, expiresAt: now + ttlMs });
+      prune(now);
+    },
+    delete: (key) => {
+      entries.delete(key);
+    },
+    clear: () => {
+      entries.clear();
+    },
+    get size() {
+      return entries.size;
+    },
+  };
+}
@@ -0,0 +1,100 @@
+/** @jest-environment node */
+
+type HttpModule = typeof import('./http');
+
+const fetchMock = jest.fn();
+
+const loadHttp = (env: Record<string, string>): HttpModule => {
+  Object.assign(process.env, env);
+  let mod: HttpModule | undefined;
+  jest.isolateModules(() => {
+    mod = require('./http');
+  });
+  return mod as HttpModule;
+};
+
+const jsonResponse = (status: number, body: unknown = {}) =>
+  new Response(JSON.stringify(body), { status, headers: { 'content-type': 'application/json' } });
+
+describe('youtube http', () => {
+  const originalFetch = global.fetch;
+
+  beforeEach(() => {
+    fetchMock.mockReset();
+    global.fetch = fetchMock as unknown as typeof fetch;
+    // Run retry backoff sleeps immediately.
+    jest.spyOn(global, 'setTimeout').mockImplementation(((fn: () => void) => {
+      fn();
+      return 0;
+    }) as unknown as typeof setTimeout);
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+    global.fetch = originalFetch;
+    delete process.env.YOUTUBE_API_RETRY_ATTEMPTS;
+    delete process.env.YOUTUBE_API_RATE_LIMIT_PER_MIN;
+    delete process.env.YOUTUBE_API_KEY;
+  });
+
+  it('fails fast on the local rate limit without retrying', async () => {
+    const http = loadHttp({ YOUTUBE_API_RETRY_ATTEMPTS: '3', YOUTUBE_API_RATE_LIMIT_PER_MIN: '1' });
+    fetchMock.mockResolvedValue(jsonResponse(200, { items: [] }));
+
+    await expect(http.fetchYouTubeJson('https://example.test/a')).resolves.toEqual({ items: [] });
+    const error = await http.fetchYouTubeJson('https://example.test/b').catch((err) => err);
+
+    expect(error).toBeInstanceOf(Error);
+    expect((error as Error).message).toBe('YOUTUBE_API_RATE_LIMITED');
+    expect(http.getYouTubeRetryAfterSec(error)).toBeGreaterThan(0);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('returns 429 with Retry-After from the video route when the local limit trips', async () => {
+    Object.assign(process.env, {
+      YOUTUBE_API_KEY: 'test-key',
+      YOUTUBE_API_RATE_LIMIT_PER_MIN: '1',
+    });
+    let GET: typeof import('@/app/api/youtube/video/route').GET | undefined;
+    jest.isolateModules(() => {
+      ({ GET } = require('@/app/api/youtube/video/route'));
+    });
+    fetchMock.mockResolvedValue(jsonResponse(200, { items: [] }));
+    const request = (id: string) =>
+      ({ url: `http://localhost/api/youtube/video?id=${id}` }) as import('next/server').NextRequest;
+
+    await GET!(request('aaaaaaaaaaa'));
+    const response = await GET!(request('bbbbbbbbbbb'));
+
+    expect(response.status).toBe(429);
+    expect(Number(response.headers.get('Retry-After'))).toBeGreaterThan(0);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('does not retry Data API 403 responses', async () => {
+    const http = loadHttp({ YOUTUBE_API_RETRY_ATTEMPTS: '3' });
+    fetchMock.mockResolvedValue(jsonResponse(403, { error: { reason: 'quotaExceeded' } }));
+
+    await expect(http.fetchYouTubeJson('https://example.test/quota')).rejects.toThrow('HTTP 403');
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('retries Data API 5xx responses up to the configured attempts', async () => {
+    const http = loadHttp({ YOUTUBE_API_RETRY_ATTEMPTS: '3' });
+    fetchMock.mockImplementation(async () => jsonResponse(503));
+
+    await expect(http.fetchYouTubeJson('https://example.test/down')).rejects.toThrow('HTTP 503');
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+  });
+
+  it('returns the last retryable response from fetchYouTubeWithRetry', async () => {
+    const http = loadHttp({ YOUTUBE_API_RETRY_ATTEMPTS: '2' });
+    fetchMock.mockImplementation(async () => new Response('busy', { status: 503 }));
+
+    const res = await http.fetchYouTubeWithRetry('https://example.test/watch');
+
+    expect(res.status).toBe(503);
+    await expect(res.text()).resolves.toBe('busy');
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+});
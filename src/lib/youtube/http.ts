@@ -0,0 +1,99 @@
+/**
+ * Shared outbound HTTP for the YouTube routes (Data API, watch pages, caption tracks).
+ *
+ * Node's global fetch already keeps connections alive per origin, so sharing one helper is
+ * mostly about giving every call the same bounded timeout and error shape instead of letting
+ * a stalled upstream hold a request open indefinitely.
+ */
+
+import { parseRetryEnvInt, withProviderRetry } from '@/lib/agents/shared/provider-retry';
+import { consumeWindowedLimit } from '@/lib/server/traffic-guards';
+
+const YOUTUBE_HTTP_TIMEOUT_MS = (() => {
+  const parsed = Number(process.env.YOUTUBE_HTTP_TIMEOUT_MS ?? 10_000);
+  return Number.isFinite(parsed) && parsed > 0 ? Math.min(60_000, Math.floor(parsed)) : 10_000;
+})();
+
+export const YOUTUBE_DATA_API_BASE = 'https://www.googleapis.com/youtube/v3';
+
+// Data API quota is per project, so the cap is process-wide rather than per user. Failing fast
+// here keeps a burst of canvas searches from tripping Google's 403/429 quota responses.
+const YOUTUBE_API_RATE_LIMIT_PER_MIN = Math.max(
+  1,
+  Number(process.env.YOUTUBE_API_RATE_LIMIT_PER_MIN ?? 120) || 120,
+);
+
+// Transient YouTube failures (429 rateLimitExceeded, 5xx, timeouts) usually clear within a
+// second; Data API quota exhaustion comes back as 403 and is not retried.
+const YOUTUBE_API_RETRY_ATTEMPTS = parseRetryEnvInt(process.env.YOUTUBE_API_RETRY_ATTEMPTS, 3, {
+  min: 1,
+  max: 5,
+});
+
+export function fetchYouTube(url: string, init: RequestInit = {}): Promise<Response> {
+  return fetch(url, {
+    method: 'GET',
+    ...init,
+    signal: init.signal ?? AbortSignal.timeout(YOUTUBE_HTTP_TIMEOUT_MS),
+  });
+}
+
+const RETRYABLE_HTTP_STATUSES = new Set([429, 500, 502, 503, 504]);
+
+/**
+ * fetchYouTube with the Data API's backoff for watch pages and caption tracks: transient 429/5xx
+ * responses and timeouts are retried, and once attempts run out the last response is returned
+ * as-is so callers keep their own status handling.
+ */
+export function fetchYouTubeWithRetry(url: string, init: RequestInit = {}): Promise<Response> {
+  let attempt = 0;
+  return withProviderRetry(
+    async () => {
+      attempt += 1;
+      const res = await fetchYouTube(url, init);
+      if (attempt < YOUTUBE_API_RETRY_ATTEMPTS && RETRYABLE_HTTP_STATUSES.has(res.status)) {
+        await res.body?.cancel().catch(() => { });
+        const error = new Error(`YouTube HTTP ${res.status}`);
+        (error as Error & { status?: number }).status = res.status;
+        throw error;
+      }
+      return res;
+    },
+    { provider: 'generic', attempts: YOUTUBE_API_RETRY_ATTEMPTS, initialDelayMs: 300 },
+  );
+}
+
+export function fetchYouTubeJson(url: string): Promise<any> {
+  return withProviderRetry(
+    async () => {
+      const rate = consumeWindowedLimit(
+        'youtube:data-api',
+        YOUTUBE_API_RATE_LIMIT_PER_MIN,
+        60_000,
+      );
+      if (!rate.ok) {
+        const error = new Error('YOUTUBE_API_RATE_LIMITED');
+        (error as Error & { retryAfterSec?: number }).retryAfterSec = rate.retryAfterSec;
+        throw error;
+      }
+      const res = await fetchYouTube(url);
+      const text = await res.text();
+      if (!res.ok) {
+        const error = new Error(`YouTube API error: HTTP ${res.status} - ${text.slice(0, 200)}`);
+        (error as Error & { status?: number }).status = res.status;
+        throw error;
+      }
+      try {
+        return JSON.parse(text) as any;
+      } catch {
+        throw new Error(`YouTube API error: invalid json - ${text.slice(0, 200)}`);
+      }
+    },
+    { provider: 'generic', attempts: YOUTUBE_API_RETRY_ATTEMPTS, initialDelayMs: 300 },
+  );
+}
+
+export function getYouTubeRetryAfterSec(error: unknown): number | null {
+  if (!(error instanceof Error) || error.message !== 'YOUTUBE_API_RATE_LIMITED') return null;
+  return (error as Error & { retryAfterSec?: number }).retryAfterSec ?? 60;
+}
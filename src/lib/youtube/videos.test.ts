@@ -0,0 +1,82 @@
+/** @jest-environment node */
+
+const mockFetchYouTubeJson = jest.fn();
+
+jest.mock('./http', () => ({
+  YOUTUBE_DATA_API_BASE: 'https://youtube.test/v3',
+  fetchYouTubeJson: (...args: unknown[]) => mockFetchYouTubeJson(...args),
+}));
+
+import { loadVideosByIds, writeCachedVideos, type YouTubeVideoItem } from './videos';
+
+const videoId = (prefix: string, n: number) => `${prefix}${String(n).padStart(10, '0')}`;
+
+const requestedIds = (url: string) => new URL(url).searchParams.get('id')?.split(',') ?? [];
+
+// Answer videos.list with every requested id except those in `missing`, in reverse order so the
+// loader has to restore the caller's order itself.
+const serveVideos = (missing: string[] = []) => {
+  mockFetchYouTubeJson.mockImplementation(async (url: string) => ({
+    items: requestedIds(url)
+      .filter((id) => !missing.includes(id))
+      .reverse()
+      .map((id) => ({ id, snippet: { title: `title ${id}` } })),
+  }));
+};
+
+const cachedVideo = (id: string): YouTubeVideoItem => ({
+  id,
+  title: `cached ${id}`,
+  description: '',
+  channelTitle: '',
+  channelId: '',
+  publishedAt: '',
+  duration: '',
+  viewCount: '0',
+  likeCount: '0',
+  commentCount: '0',
+  thumbnail: { url: '', width: 0, height: 0 },
+});
+
+describe('loadVideosByIds', () => {
+  beforeEach(() => {
+    mockFetchYouTubeJson.mockReset();
+  });
+
+  it('keeps the caller order across cache hits and misses and drops unknown ids', async () => {
+    const [first, cached, unknown, last] = [1, 2, 3, 4].map((n) => videoId('a', n));
+    writeCachedVideos([cachedVideo(cached)]);
+    serveVideos([unknown]);
+
+    const items = await loadVideosByIds([first, cached, unknown, last], 'key');
+
+    expect(items.map((item) => item.id)).toEqual([first, cached, last]);
+    expect(items[1]?.title).toBe(`cached ${cached}`);
+    expect(mockFetchYouTubeJson).toHaveBeenCalledTimes(1);
+    expect(requestedIds(mockFetchYouTubeJson.mock.calls[0][0])).toEqual([first, unknown, last]);
+  });
+
+  it('splits more than 50 misses into one videos.list call per 50 ids', async () => {
+    const ids = Array.from({ length: 51 }, (_, index) => videoId('b', index));
+    serveVideos();
+
+    const items = await loadVideosByIds(ids, 'key');
+
+    expect(items.map((item) => item.id)).toEqual(ids);
+    expect(mockFetchYouTubeJson).toHaveBeenCalledTimes(2);
+    expect(mockFetchYouTubeJson.mock.calls.map(([url]) => requestedIds(url).length)).toEqual([
+      50, 1,
+    ]);
+  });
+
+  it('serves a repeated lookup from the per-id cache', async () => {
+    const ids = [videoId('c', 1), videoId('c', 2)];
+    serveVideos();
+
+    const first = await loadVideosByIds(ids, 'key');
+    const second = await loadVideosByIds(ids, 'key');
+
+    expect(second).toEqual(first);
+    expect(mockFetchYouTubeJson).toHaveBeenCalledTimes(1);
+  });
+});
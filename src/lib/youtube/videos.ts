@@ -0,0 +1,112 @@
+/**
+ * Normalized YouTube Data API video shape shared by the search and video routes.
+ */
+
+import { createTtlCache, parseTtlSecEnv } from '@/lib/server/ttl-cache';
+import { YOUTUBE_DATA_API_BASE, fetchYouTubeJson } from './http';
+
+// Video ids are always 11 URL-safe base64 characters; anything else cannot resolve upstream.
+export const YOUTUBE_VIDEO_ID_PATTERN = /^[A-Za-z0-9_-]{11}$/;
+
+export type YouTubeThumbnail = { url: string; width: number; height: number };
+
+export type YouTubeVideoItem = {
+  id: string;
+  title: string;
+  description: string;
+  channelTitle: string;
+  channelId: string;
+  publishedAt: string;
+  duration: string;
+  viewCount: string;
+  likeCount: string;
+  commentCount: string;
+  thumbnail: YouTubeThumbnail;
+};
+
+export function pickBestThumb(snippet: any): YouTubeThumbnail {
+  const thumbs = snippet?.thumbnails || {};
+  const best = thumbs.maxres || thumbs.high || thumbs.medium || thumbs.default;
+  if (best?.url) {
+    return {
+      url: String(best.url),
+      width: Number(best.width) || 0,
+      height: Number(best.height) || 0,
+    };
+  }
+  return { url: '', width: 0, height: 0 };
+}
+
+export function mapVideo(item: any): YouTubeVideoItem {
+  const snippet = item?.snippet || {};
+  const stats = item?.statistics || {};
+  const details = item?.contentDetails || {};
+  return {
+    id: String(item?.id || ''),
+    title: String(snippet?.title || ''),
+    description: String(snippet?.description || ''),
+    channelTitle: String(snippet?.channelTitle || ''),
+    channelId: String(snippet?.channelId || ''),
+    publishedAt: String(snippet?.publishedAt || ''),
+    duration: String(details?.duration || ''),
+    viewCount: String(stats?.viewCount ?? '0'),
+    likeCount: String(stats?.likeCount ?? '0'),
+    commentCount: String(stats?.commentCount ?? '0'),
+    thumbnail: pickBestThumb(snippet),
+  };
+}
+
+// Video metadata is keyed by id alone, so one entry serves every route and search that
+// surfaces the same video. Statistics drift slowly; a short TTL keeps counts roughly current.
+const videoCache = createTtlCache<YouTubeVideoItem>({
+  ttlMs: parseTtlSecEnv(process.env.YOUTUBE_VIDEO_CACHE_TTL_SEC, 600),
+  maxEntries: 2000,
+});
+
+export function readCachedVideo(id: string): YouTubeVideoItem | null {
+  return videoCache.get(id);
+}
+
+export function writeCachedVideos(items: YouTubeVideoItem[]) {
+  for (const item of items) {
+    if (item.id) videoCache.set(item.id, item);
+  }
+}
+
+// videos.list accepts up to 50 ids per call for the same quota cost as one.
+const VIDEOS_LIST_MAX_IDS = 50;
+
+/**
+ * Resolve ids to normalized videos in the given order, serving cached entries from memory and
+ * fetching only the misses, one videos.list call per 50 ids. Unknown ids are dropped.
+ */
+export async function loadVideosByIds(ids: string[], apiKey: string): Promise<YouTubeVideoItem[]> {
+  const byId = new Map<string, YouTubeVideoItem>();
+  const missingIds: string[] = [];
+  for (const id of ids) {
+    const cached = readCachedVideo(id);
+    if (cached) byId.set(id, cached);
+    else missingIds.push(id);
+  }
+
+  const batches: string[][] = [];
+  for (let i = 0; i < missingIds.length; i += VIDEOS_LIST_MAX_IDS) {
+    batches.push(missingIds.slice(i, i + VIDEOS_LIST_MAX_IDS));
+  }
+  await Promise.all(
+    batches.map(async (batch) => {
+      const url = new URL(`${YOUTUBE_DATA_API_BASE}/videos`);
+      url.searchParams.set('part', 'snippet,contentDetails,statistics');
+      url.searchParams.set('id', batch.join(','));
+      url.searchParams.set('key', apiKey);
+      const json = await fetchYouTubeJson(url.toString());
+      const fetched = (Array.isArray(json?.items) ? json.items : []).map(mapVideo);
+      writeCachedVideos(fetched);
+      for (const item of fetched) byId.set(item.id, item);
+    }),
+  );
+
+  return ids
+    .map((id) => byId.get(id))
+    .filter((item): item is YouTubeVideoItem => Boolean(item));
+}